@@ -1,3 +1,4 @@
 from .auth import auth_route
 from .test import test_route
 from .ask import ask_route
+from .metrics import metrics_route
@@ -4,26 +4,28 @@ Ask endpoints — protected by JWT cookie auth.
 Endpoints
 ---------
 POST   /ask                              → full JSON (creates/continues session)
-GET    /ask/stream                       → SSE token-by-token (creates/continues session)
-GET    /ask/sessions                     → list all conversation sessions for current user
-GET    /ask/sessions/{session_id}        → messages for a specific session
+GET    /ask/stream                       → SSE token-by-token (creates/continues session,
+                                           or resumes a run via Last-Event-ID / run_id)
+GET    /ask/sessions                     → cursor-paginated sessions, most recent activity first
+GET    /ask/sessions/{session_id}        → cursor-paginated messages for a specific session
 DELETE /ask/sessions/{session_id}        → delete a session and all its messages
 """
 import asyncio
-import json
 import logging
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core import get_async_session
-from graph import AgentState
-from models import Users
+from api.sse import DONE_FRAME, cancel_on_disconnect, coalesce_tokens, frame
+from core import get_async_session, Settings, metrics
+from graph import AgentState, speculative_events, solve_math
 from repository.conversation_repository import ConversationRepository
-from schema import AskRequest, AskResponse, MessageOut, SessionOut, RenameSessionRequest
+from schema import AskRequest, AskResponse, MessageOut, MessagePage, SessionOut, SessionPage, RenameSessionRequest
 from security.filter import get_current_user
-from services.ask_service import AskService
+from security.principal import Principal
+from services.ask_service import AskService, ask_service_scope, schedule_partial_turn
+from services.stream_runs import ReplayUnavailable, stream_runs
 
 logger = logging.getLogger(__name__)
 
@@ -43,27 +45,75 @@ def _get_graph(request: Request):
     return request.app.state.graph
 
 
+def _record_cancelled(tokens_streamed: int) -> None:
+    """Count a stream cancelled by its client and estimate the tokens it saved."""
+    metrics.incr("ask.stream.cancelled")
+    metrics.observe("ask.stream.tokens_at_cancel", tokens_streamed)
+    mean_answer = metrics.mean("ask.stream.answer_tokens")
+    if mean_answer is not None:
+        metrics.incr("ask.stream.tokens_saved", max(0.0, mean_answer - tokens_streamed))
+
+
+def _title_event(session_id: str, title: str) -> bytes:
+    return frame({"type": "title", "session_id": session_id, "session_name": title})
+
+
+def _resume_point(last_event_id: str | None, run_id: str | None) -> tuple[str, int] | None:
+    """(run id, last seen seq) from a `<run_id>:<seq>` Last-Event-ID or a bare run_id."""
+    if last_event_id:
+        rid, _, seq = last_event_id.rpartition(":")
+        if rid and seq.isdigit() and (run_id is None or run_id == rid):
+            return rid, int(seq)
+    if run_id:
+        return run_id, 0
+    return None
+
+
+def _stream_response(request: Request, frames) -> StreamingResponse:
+    return StreamingResponse(
+        cancel_on_disconnect(request, frames, Settings.SSE_DISCONNECT_POLL_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _session_out(session) -> SessionOut:
+    return SessionOut(
+        id=session.id,
+        name=session.name,
+        created_at=str(session.created_at),
+        last_message_at=str(session.last_message_at) if session.last_message_at else None,
+        message_count=session.message_count or 0,
+        preview=session.last_message_preview,
+    )
+
+
 # ── POST /ask  (classic JSON response) ───────────────────────────────────────
 @ask_route.post("", response_model=AskResponse)
 async def ask(
     body: AskRequest,
     request: Request,
-    current_user: Users = Depends(get_current_user),
-    service: AskService = Depends(get_ask_service),
+    current_user: Principal = Depends(get_current_user),
 ):
     """Protected chat endpoint — returns a full JSON response."""
     graph = _get_graph(request)
 
-    session = await service.get_or_create_session(current_user.id, body.session_id)
-    history = await service.load_history(session.id)
-
-    result = await graph.ainvoke(input=AgentState(query=body.query, history=history))
-    answer = result.get("answer") or ""
+    # Self-contained arithmetic is answered locally without any LLM call
+    answer = solve_math(body.query)
+    source = "mcp_math" if answer is not None else None
 
-    await service.save_turn(session.id, body.query, answer)
+    # Short-lived DB sessions: no connection is held while the graph runs
+    async with ask_service_scope() as service:
+        session, summary, history = await service.begin_turn(
+            current_user.id, body.session_id, with_context=answer is None
+        )
+    if answer is None:
+        result = await graph.ainvoke(input=AgentState(query=body.query, history=history, summary=summary))
+        answer = result.get("answer") or ""
 
-    # Fire-and-forget title generation (first turn only)
-    asyncio.create_task(service.maybe_set_title(session, body.query, answer))
+    # First turn: a local title is saved with the turn, the LLM one is queued
+    async with ask_service_scope() as service:
+        await service.complete_turn(session, body.query, answer, source=source)
 
     return AskResponse(
         answer=answer,
@@ -75,25 +125,87 @@ async def ask(
 # ── GET /ask/stream  (SSE streaming) ─────────────────────────────────────────
 @ask_route.get("/stream")
 async def ask_stream(
-    query: str,
     request: Request,
-    current_user: Users = Depends(get_current_user),
-    service: AskService = Depends(get_ask_service),
+    query: str | None = None,
+    current_user: Principal = Depends(get_current_user),
     session_id: str | None = None,
+    run_id: str | None = None,
+    last_event_id: str | None = Header(None),
+    coalesce_ms: int | None = Query(None, ge=0, le=1000),
+    coalesce_bytes: int | None = Query(None, ge=0, le=65536),
 ):
     """
     Protected SSE streaming endpoint — token-by-token response.
 
+    Tokens are coalesced into fewer frames (see api/sse.py). The first token
+    is sent at once; later ones within `coalesce_ms` or until
+    `coalesce_bytes` characters are merged. Both default to Settings and
+    `coalesce_ms=0` streams every token as its own frame.
+
+    The answer is generated by a stream run (services/stream_runs.py) that
+    buffers its frames; every event carries `id: <run_id>:<seq>`. A client
+    that lost the connection reconnects with the `Last-Event-ID` header (or
+    `run_id`, to replay from the start) and no `query`: the missed events
+    are replayed from the buffer and the run is followed live if it is
+    still generating — no new LLM call. 404 if the run is unknown or
+    expired, 410 if the requested events were already trimmed.
+
+    If no client is connected for STREAM_RESUME_GRACE_SECONDS the run is
+    cancelled; the partial answer is saved when STREAM_PERSIST_PARTIAL is on.
+
     Event format:
-        data: {"type": "session",  "session_id": "...", "session_name": "..."}\\n\\n
+        data: {"type": "session",  "session_id": "...", "session_name": "...", "run_id": "..."}\\n\\n
         data: {"type": "token",    "token": "..."}\\n\\n
         data: {"type": "done"}\\n\\n
+        data: {"type": "title",   "session_id": "...", "session_name": "..."}\\n\\n
         data: {"type": "error",   "error": "..."}\\n\\n
+
+    On a session's first turn `title` events follow `done`: the local title
+    at once (TITLE_STRATEGY local / hybrid), then the LLM title when its
+    background job finishes, waiting at most TITLE_PUSH_TIMEOUT_SECONDS.
+
+    The DB is used in two short-lived sessions — one to resolve the session
+    and its context, one to persist the turn — and no connection
+    is held while the answer streams.
     """
+    resume = _resume_point(last_event_id, run_id)
+    if resume is not None:
+        run = stream_runs.get(resume[0], current_user.id)
+        if run is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stream run not found or expired")
+        try:
+            return _stream_response(request, run.read(after=resume[1]))
+        except ReplayUnavailable:
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail="Stream events no longer available")
+    if not query:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="query is required")
+
     graph = _get_graph(request)
-    session = await service.get_or_create_session(current_user.id, session_id)
-    history = await service.load_history(session.id)
-    state = AgentState(query=query, history=history)
+    fast_answer = solve_math(query)
+    async with ask_service_scope() as service:
+        session, summary, history = await service.begin_turn(
+            current_user.id, session_id, with_context=fast_answer is None
+        )
+    state = AgentState(query=query, history=history, summary=summary)
+
+    async def persist(answer: str, source: str) -> asyncio.Future | None:
+        """Save the turn and queue its post-turn jobs; returns the LLM title future."""
+        async with ask_service_scope() as service:
+            return await service.complete_turn(session, query, answer, source=source)
+
+    async def title_events(unnamed: bool, title_future: asyncio.Future | None):
+        """After `done`: the local title at once, then the LLM title when it lands."""
+        if unnamed and session.name is not None:
+            yield _title_event(session.id, session.name)
+        if title_future is not None:
+            try:
+                title = await asyncio.wait_for(
+                    asyncio.shield(title_future), timeout=Settings.TITLE_PUSH_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                title = None
+            if title:
+                yield _title_event(session.id, title)
 
     # Tool name sets for source classification
     _MATH_TOOLS = {
@@ -102,90 +214,138 @@ async def ask_stream(
     }
 
     async def event_generator():
+        unnamed = session.name is None
         # Emit session metadata first so client can track the session
-        yield f"data: {json.dumps({'type': 'session', 'session_id': session.id, 'session_name': session.name})}\n\n"
-
+        yield frame({
+            "type": "session", "session_id": session.id, "session_name": session.name, "run_id": run.run_id,
+        })
+
+        if fast_answer is not None:
+            # Answered locally — stream the whole result as one token
+            yield fast_answer
+            yield frame({"type": "source", "source": "mcp_math"})
+            title_future = None
+            try:
+                title_future = await persist(fast_answer, "mcp_math")
+            except Exception as exc:
+                logger.exception("Streaming error: %s", exc)
+                yield frame({"type": "error", "error": str(exc)})
+            yield DONE_FRAME
+            async for event in title_events(unnamed, title_future):
+                yield event
+            return
+
+        title_future = None
         full_answer: list[str] = []
         tools_called: set[str] = set()
         final_node: str = "chat_node"
         try:
-            async for event in graph.astream_events(input=state, version="v2"):
-                kind = event.get("event")
-
-                # Track which tools were actually invoked
-                if kind == "on_tool_start":
-                    tool_name = event.get("name", "")
-                    tools_called.add(tool_name)
-
-                if kind == "on_chat_model_stream":
-                    node_name = event.get("metadata", {}).get("langgraph_node", "")
-                    # Only stream tokens from the answer nodes, not the classifier
-                    if node_name in ("chat_node", "mcp_node"):
-                        final_node = node_name
-                        token = event["data"]["chunk"].content
-                        if token:
-                            full_answer.append(token)
-                            yield f"data: {json.dumps({'type': 'token', 'token': token}, ensure_ascii=False)}\n\n"
+            if Settings.SPECULATIVE_CHAT:
+                events = speculative_events(graph, state)
+            else:
+                events = graph.astream_events(input=state, version="v2")
+            try:
+                async for event in events:
+                    kind = event.get("event")
+
+                    # Track which tools were actually invoked
+                    if kind == "on_tool_start":
+                        tool_name = event.get("name", "")
+                        tools_called.add(tool_name)
+
+                    if kind == "on_chat_model_stream":
+                        node_name = event.get("metadata", {}).get("langgraph_node", "")
+                        # Only stream tokens from the answer nodes, not the classifier
+                        if node_name in ("chat_node", "mcp_node"):
+                            final_node = node_name
+                            token = event["data"]["chunk"].content
+                            if token:
+                                full_answer.append(token)
+                                yield token
+            except asyncio.CancelledError:
+                # Run abandoned (no client within the grace period) or shutdown
+                _record_cancelled(len(full_answer))
+                if Settings.STREAM_PERSIST_PARTIAL and full_answer:
+                    schedule_partial_turn(session, query, "".join(full_answer))
+                raise
+            metrics.observe("ask.stream.answer_tokens", len(full_answer))
 
             # Determine response source
             if tools_called & _MATH_TOOLS:
                 source = "mcp_math"
             else:
                 source = "chat"
-            yield f"data: {json.dumps({'type': 'source', 'source': source})}\n\n"
+            yield frame({"type": "source", "source": source})
 
-            # Persist and generate title after full answer
+            # Persist after full answer; the title is generated in the background
             answer_text = "".join(full_answer)
             if answer_text:
-                await service.save_turn(session.id, query, answer_text, source=source)
-                await service.maybe_set_title(session, query, answer_text)
+                title_future = await persist(answer_text, source)
 
         except Exception as exc:
             logger.exception("Streaming error: %s", exc)
-            yield f"data: {json.dumps({'type': 'error', 'error': str(exc)})}\n\n"
+            yield frame({"type": "error", "error": str(exc)})
 
-        yield f"data: {json.dumps({'type': 'done'})}\n\n"
+        yield DONE_FRAME
+        async for event in title_events(unnamed, title_future):
+            yield event
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
-    )
+    window_ms = Settings.SSE_COALESCE_WINDOW_MS if coalesce_ms is None else coalesce_ms
+    max_bytes = Settings.SSE_COALESCE_MAX_BYTES if coalesce_bytes is None else coalesce_bytes
+    run = stream_runs.create(current_user.id)
+    stream_runs.start(run, coalesce_tokens(event_generator(), window_ms / 1000, max_bytes))
+    return _stream_response(request, run.read())
 
 
 # ── GET /ask/sessions  (list user's sessions) ────────────────────────────────
-@ask_route.get("/sessions", response_model=list[SessionOut])
+@ask_route.get("/sessions", response_model=SessionPage)
 async def list_sessions(
-    current_user: Users = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: AskService = Depends(get_ask_service),
+    limit: int = Query(50, ge=1, le=200),
+    before: str | None = None,
 ):
-    """Return all conversation sessions for the current user, newest first."""
-    sessions = await service.list_sessions(current_user.id)
-    return [
-        SessionOut(id=s.id, name=s.name, created_at=str(s.created_at))
-        for s in sessions
-    ]
+    """Return a page of the current user's sessions, most recent activity first."""
+    sessions, next_cursor = await service.list_sessions(current_user.id, limit, before)
+    return SessionPage(
+        sessions=[_session_out(s) for s in sessions],
+        next_cursor=next_cursor,
+    )
 
 
 # ── GET /ask/sessions/{session_id}  (messages in a session) ──────────────────
-@ask_route.get("/sessions/{session_id}", response_model=list[MessageOut])
+@ask_route.get("/sessions/{session_id}", response_model=MessagePage)
 async def get_session_messages(
     session_id: str,
-    current_user: Users = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: AskService = Depends(get_ask_service),
+    limit: int = Query(50, ge=1, le=200),
+    before: str | None = None,
+    after: str | None = None,
 ):
-    """Return all messages in a session (must belong to current user)."""
-    msgs = await service.get_session_messages(session_id, current_user.id)
-    return [
-        MessageOut(
-            id=m.id,
-            role=m.role.value,
-            content=m.content,
-            source=m.source,
-            created_at=str(m.created_at),
-        )
-        for m in msgs
-    ]
+    """
+    Return a page of messages in a session (must belong to current user).
+
+    No cursor → newest `limit` messages. `before=<message id>` → the page
+    just older than it; `after=<message id>` → the page just newer. Messages
+    are always oldest first; `next_cursor` continues in the same direction.
+    """
+    msgs, next_cursor = await service.get_session_messages(
+        session_id, current_user.id, limit, before=before, after=after
+    )
+    return MessagePage(
+        messages=[
+            MessageOut(
+                id=m.id,
+                role=m.role.value,
+                content=m.content,
+                source=m.source,
+                created_at=str(m.created_at),
+            )
+            for m in msgs
+        ],
+        next_cursor=next_cursor,
+    )
 
 
 # ── PATCH /ask/sessions/{session_id}  (rename) ───────────────────────────────
@@ -193,19 +353,19 @@ async def get_session_messages(
 async def rename_session(
     session_id: str,
     body: RenameSessionRequest,
-    current_user: Users = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: AskService = Depends(get_ask_service),
 ):
     """Rename a session (must belong to current user)."""
     session = await service.rename_session(session_id, current_user.id, body.name)
-    return SessionOut(id=session.id, name=session.name, created_at=str(session.created_at))
+    return _session_out(session)
 
 
 # ── DELETE /ask/sessions/{session_id} ────────────────────────────────────────
 @ask_route.delete("/sessions/{session_id}")
 async def delete_session(
     session_id: str,
-    current_user: Users = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: AskService = Depends(get_ask_service),
 ):
     """Delete a session and all its messages (cascaded)."""
@@ -3,11 +3,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core import get_async_session, Settings
 from exceptions import UserAlreadyExistsException, InvalidCredentialsException
-from models import Users
 from repository import UserRepository
 from repository.refresh_tokens_repository import RefreshTokensRepository
 from schema import CreateUser, ReadUser
 from security.filter import get_current_user
+from security.principal import Principal
 from services.auth_services import AuthServices
 
 auth_route = APIRouter(prefix="/auth", tags=["Auth"])
@@ -74,7 +74,7 @@ async def login_user(response: Response, data: CreateUser, service: AuthServices
 
 
 @auth_route.get("/me", response_model=ReadUser)
-async def get_me(current_user: Users = Depends(get_current_user)):
+async def get_me(current_user: Principal = Depends(get_current_user)):
     """Return the currently authenticated user's profile."""
     return current_user
 
@@ -82,7 +82,7 @@ async def get_me(current_user: Users = Depends(get_current_user)):
 @auth_route.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
         response: Response,
-        current_user: Users = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_user),
         service: AuthServices = Depends(get_auth_service),
 ):
     """Revoke all server-side refresh tokens and clear auth cookies."""
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from core import metrics
+
+metrics_route = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@metrics_route.get("")
+def get_metrics():
+    """Return a snapshot of this worker's in-process counters and timings."""
+    return metrics.snapshot()
@@ -0,0 +1,164 @@
+"""
+SSE framing and token coalescing for the streaming endpoints.
+
+Event generators yield two kinds of items:
+
+  bytes  a complete, already-encoded SSE frame (session, source, done, …)
+  str    a piece of answer text, to be sent as a `token` frame
+
+coalesce_tokens() sits between such a generator and the StreamingResponse.
+The first token is sent at once; later tokens are buffered and sent as one
+frame when the buffer is `window` seconds old or holds `max_bytes`
+characters, whichever comes first (window <= 0 disables coalescing,
+max_bytes <= 0 the size limit). Any other frame flushes the buffer
+first, so ordering is preserved. Token frames are built from a pre-encoded
+template: only the text itself goes through json.dumps.
+
+cancel_on_disconnect() wraps the outermost stream and polls the client
+connection; on disconnect it cancels the step in flight, which unwinds
+everything beneath it. For /ask/stream that is only a reader of the
+stream run's replay buffer; the run itself (coalescer pump, graph run,
+LLM and tool calls) is cancelled by services/stream_runs.py once no
+client has reconnected within the grace period.
+
+Metrics (per stream): sse.frames, sse.bytes, sse.token_frames and
+sse.tokens_per_frame; sse.disconnected counts cancelled streams.
+"""
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import Request
+
+from core import metrics
+
+_TOKEN_FRAME = b'data: {"type": "token", "token": %s}\n\n'
+
+DONE_FRAME = b'data: {"type": "done"}\n\n'
+
+_END = object()
+
+
+def frame(payload: dict) -> bytes:
+    """Encode one SSE `data:` frame."""
+    return b"data: %s\n\n" % json.dumps(payload, ensure_ascii=False).encode()
+
+
+def token_frame(text: str) -> bytes:
+    return _TOKEN_FRAME % json.dumps(text, ensure_ascii=False).encode()
+
+
+async def coalesce_tokens(
+    source: AsyncIterator[str | bytes], window: float, max_bytes: int
+) -> AsyncIterator[bytes]:
+    """Merge consecutive tokens from `source` into fewer token frames."""
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for item in source:
+                queue.put_nowait(item)
+        except Exception as exc:
+            queue.put_nowait(exc)
+        queue.put_nowait(_END)
+
+    loop = asyncio.get_running_loop()
+    pump_task = asyncio.create_task(pump())
+    pending: list[str] = []
+    pending_size = 0
+    deadline: float | None = None
+    first_token = True
+    frames = token_frames = tokens = sent = 0
+
+    def flush() -> bytes:
+        nonlocal pending_size, deadline, frames, token_frames, sent
+        data = token_frame("".join(pending))
+        pending.clear()
+        pending_size = 0
+        deadline = None
+        frames += 1
+        token_frames += 1
+        sent += len(data)
+        return data
+
+    try:
+        while True:
+            if deadline is None:
+                item = await queue.get()
+            else:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    yield flush()
+                    continue
+
+            if item is _END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            if isinstance(item, str):
+                tokens += 1
+                if first_token or window <= 0:
+                    first_token = False
+                    pending.append(item)
+                    yield flush()
+                    continue
+                pending.append(item)
+                pending_size += len(item)
+                if deadline is None:
+                    deadline = loop.time() + window
+                if max_bytes > 0 and pending_size >= max_bytes:
+                    yield flush()
+                continue
+
+            if pending:
+                yield flush()
+            frames += 1
+            sent += len(item)
+            yield item
+
+        if pending:
+            yield flush()
+    finally:
+        pump_task.cancel()
+        metrics.observe("sse.frames", frames)
+        metrics.observe("sse.bytes", sent)
+        if token_frames:
+            metrics.observe("sse.token_frames", token_frames)
+            metrics.observe("sse.tokens_per_frame", tokens / token_frames)
+
+
+async def _wait_for_disconnect(request: Request, poll_interval: float) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(poll_interval)
+
+
+async def cancel_on_disconnect(
+    request: Request, stream: AsyncIterator[bytes], poll_interval: float
+) -> AsyncIterator[bytes]:
+    """Forward `stream` until it ends or the client goes away, then cancel it."""
+    watcher = asyncio.create_task(_wait_for_disconnect(request, poll_interval))
+    try:
+        while True:
+            step = asyncio.ensure_future(anext(stream))
+            try:
+                await asyncio.wait({step, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                # The server cancelled the response (e.g. its own disconnect listener)
+                step.cancel()
+                raise
+            if not step.done():
+                metrics.incr("sse.disconnected")
+                step.cancel()
+                try:
+                    await step
+                except (asyncio.CancelledError, StopAsyncIteration):
+                    pass
+                return
+            try:
+                item = step.result()
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        watcher.cancel()
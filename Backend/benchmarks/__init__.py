@@ -0,0 +1 @@
+# Benchmarks package — run from Backend/ with: python -m benchmarks.<name>
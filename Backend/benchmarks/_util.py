@@ -0,0 +1,41 @@
+"""
+Shared benchmark helpers.
+
+measure_loop_lag() runs a heartbeat task that asks to wake every
+HEARTBEAT_INTERVAL seconds and records how late each wake-up is; the lag
+shows how long the event loop was blocked while the benchmarked work ran.
+"""
+import asyncio
+import math
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+HEARTBEAT_INTERVAL = 0.01
+
+
+def p99(values: list[float]) -> float:
+    """Nearest-rank 99th percentile (the maximum for fewer than 100 values)."""
+    values = sorted(values)
+    return values[max(0, math.ceil(len(values) * 0.99) - 1)]
+
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+@asynccontextmanager
+async def measure_loop_lag() -> AsyncIterator[list[float]]:
+    """Yield the list of heartbeat lags (seconds), filled while the block runs."""
+    lags: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_heartbeat(lags, stop))
+    await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+    try:
+        yield lags
+    finally:
+        stop.set()
+        await monitor
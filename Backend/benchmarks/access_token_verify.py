@@ -0,0 +1,54 @@
+"""
+Access-token verification microbenchmark — full JWT decode vs claims cache.
+
+Times verify_access_token() on one token presented repeatedly, the way a
+streaming session and sidebar polling present the same cookie:
+
+  before  jwt.decode() on every call (signature + claims validation)
+  after   verify_access_token() — one decode, then sha256 + cache lookups
+
+Needs no database. ACCESS_SECRET_KEY / ALGORITHM fall back to throwaway
+values when not set. Run from Backend/ with:
+python -m benchmarks.access_token_verify
+"""
+import argparse
+import os
+import timeit
+
+os.environ.setdefault("ACCESS_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
+
+from jose import jwt  # noqa: E402
+
+from core import Settings, metrics  # noqa: E402
+from security.utils import create_access_token, verify_access_token  # noqa: E402
+
+
+def _report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<7} {seconds / iterations * 1e6:8.2f} µs/call  ({iterations} calls)")
+
+
+def main(iterations: int) -> None:
+    token = create_access_token({"sub": "0190c7a2-0000-7000-8000-000000000000"})
+
+    def before():
+        return jwt.decode(token, Settings.ACCESS_SECRET_KEY, algorithms=[Settings.ALGORITHM])
+
+    def after():
+        return verify_access_token(token)
+
+    _report("before", timeit.timeit(before, number=iterations), iterations)
+    _report("after", timeit.timeit(after, number=iterations), iterations)
+    counters = metrics.snapshot()["counters"]
+    print(
+        f"cache hits={counters.get('cache.access_tokens.hit', 0)} "
+        f"misses={counters.get('cache.access_tokens.miss', 0)}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,107 @@
+"""
+Event-loop lag benchmark for the context classifier.
+
+Runs N concurrent classifications against a simulated classifier LLM and
+measures how late a 10 ms heartbeat task wakes up while they are in flight.
+
+  before  legacy sync node — chain.invoke() blocks the loop per request
+  after   classify_with_llm() — chain.ainvoke() yields while waiting
+
+Both arms call the classifier LLM on every request: "after" bypasses the
+pre-router and routing cache, which would otherwise answer without it.
+Each line reports how many LLM calls were made (calls=) as a check.
+
+No network calls are made; the LLM is replaced by a sleep of --latency ms.
+Run from Backend/ with: python -m benchmarks.context_loop_lag
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+
+from benchmarks._util import measure_loop_lag, p99
+from graph.agents import context_agent
+from graph.prompts import CONTEXT_AGENT_PROMPT
+from graph.state import AgentState
+
+# Classifier LLM calls made by the fake LLM, reset per run
+_calls = 0
+
+
+def _fake_llm(latency: float) -> RunnableLambda:
+    def _invoke(_prompt):
+        global _calls
+        _calls += 1
+        time.sleep(latency)
+        return AIMessage(content="chat")
+
+    async def _ainvoke(_prompt):
+        global _calls
+        _calls += 1
+        await asyncio.sleep(latency)
+        return AIMessage(content="chat")
+
+    return RunnableLambda(_invoke, afunc=_ainvoke)
+
+
+def _legacy_context_node(llm):
+    """The pre-async node: sync invoke, prompt rebuilt on every call."""
+    def node(state: AgentState) -> AgentState:
+        recent_history = state.history[-4:] if state.history else []
+        history_text = "\n".join([f"{h['role'].title()}: {h['content']}" for h in recent_history])
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", CONTEXT_AGENT_PROMPT),
+                ("human", "Recent context:\n{history}\n\nUser query: {input}"),
+            ]
+        )
+        response = (prompt | llm).invoke({"input": state.query, "history": history_text or "No prior context."})
+        return state.model_copy(update={"node": response.content.strip().lower()})
+    return node
+
+
+async def _run(label: str, classify, concurrency: int) -> None:
+    global _calls
+    _calls = 0
+    # In the pre-router's ambiguous band: only the LLM can route it
+    state = AgentState(query="can you help me with the next one?", history=[])
+    async with measure_loop_lag() as lags:
+        start = time.perf_counter()
+        await asyncio.gather(*(classify(state) for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+    print(
+        f"{label:<7} wall={wall * 1000:8.1f} ms  "
+        f"lag max={max(lags) * 1000:8.1f} ms  p99={p99(lags) * 1000:8.1f} ms  "
+        f"mean={statistics.mean(lags) * 1000:6.2f} ms  heartbeats={len(lags)}  calls={_calls}"
+    )
+
+
+async def main(concurrency: int, latency: float) -> None:
+    llm = _fake_llm(latency)
+    legacy = _legacy_context_node(llm)
+
+    async def before(state):
+        # LangGraph calls a sync node inline on the event loop
+        return legacy(state)
+
+    context_agent.configure(llm)
+
+    print(f"{concurrency} concurrent classifications, simulated LLM latency {latency * 1000:.0f} ms")
+    await _run("before", before, concurrency)
+    async def after(state):
+        return await context_agent.classify_with_llm(state.query, state.history)
+
+    await _run("after", after, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=150, help="simulated classifier latency in ms")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.latency / 1000))
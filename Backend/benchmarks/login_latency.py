@@ -0,0 +1,73 @@
+"""
+Login latency benchmark — inline Argon2 vs the password pool.
+
+Fires N concurrent password verifications, each standing in for one login
+request, alongside a 10 ms heartbeat task that stands in for a chat stream
+on the same worker. Reports per-login p50/p99 and heartbeat lag.
+
+  before  legacy verify — pwd_context.verify() runs inline on the loop
+  after   verify_password() — Argon2 runs on the bounded password pool
+
+Uses the configured ARGON2_* parameters; no database is needed.
+Logins rejected with 503 by a saturated pool are counted separately.
+Run from Backend/ with: python -m benchmarks.login_latency
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import HTTPException
+
+from benchmarks._util import measure_loop_lag, p99
+from security.utils import pwd_context, verify_password
+
+PASSWORD = "correct horse battery staple"
+
+
+async def _run(label: str, verify, concurrency: int) -> None:
+    latencies: list[float] = []
+    rejected = 0
+
+    async def login() -> None:
+        nonlocal rejected
+        start = time.perf_counter()
+        try:
+            await verify()
+        except HTTPException:
+            rejected += 1
+            return
+        latencies.append(time.perf_counter() - start)
+
+    async with measure_loop_lag() as lags:
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+    print(
+        f"{label:<7} wall={wall * 1000:8.1f} ms  "
+        f"login p50={statistics.median(latencies) * 1000:8.1f} ms  p99={p99(latencies) * 1000:8.1f} ms  "
+        f"lag max={max(lags) * 1000:8.1f} ms  p99={p99(lags) * 1000:8.1f} ms  rejected={rejected}"
+    )
+
+
+async def main(concurrency: int) -> None:
+    hashed = pwd_context.hash(PASSWORD)
+
+    async def before():
+        # The pre-pool handler: sync verify inside the async route
+        return pwd_context.verify(PASSWORD, hashed)
+
+    async def after():
+        return await verify_password(PASSWORD, hashed)
+
+    print(f"{concurrency} concurrent logins")
+    await _run("before", before, concurrency)
+    await _run("after", after, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency))
@@ -0,0 +1,86 @@
+"""
+SSE coalescing benchmark — frames, bytes and CPU per streamed answer.
+
+Replays a simulated fast model (short tokens a few ms apart) through:
+
+  before     the legacy per-token path — json.dumps of a dict per token
+  after      api.sse.coalesce_tokens() at several window / size settings
+
+and reports, per answer, SSE frames, bytes written, process CPU time and
+time to the first frame. No LLM or server is involved.
+Run from Backend/ with: python -m benchmarks.sse_coalescing
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from api.sse import DONE_FRAME, coalesce_tokens
+
+WORDS = (
+    "the area of a circle is pi times the radius squared so with a radius of three "
+    "units the area comes to about twenty eight point two seven square units"
+).split()
+
+
+def _tokens(count: int) -> list[str]:
+    rng = random.Random(7)
+    pieces = []
+    for i in range(count):
+        word = WORDS[i % len(WORDS)]
+        # Split words into 1–2 sub-word pieces like a BPE tokenizer would
+        cut = rng.randint(1, len(word)) if len(word) > 3 and rng.random() < 0.4 else len(word)
+        pieces.extend([" " + word[:cut]] + ([word[cut:]] if cut < len(word) else []))
+    return pieces[:count]
+
+
+async def _model(tokens: list[str], interval: float):
+    for token in tokens:
+        await asyncio.sleep(interval)
+        yield token
+
+
+async def _legacy(tokens: list[str], interval: float):
+    async for token in _model(tokens, interval):
+        yield f"data: {json.dumps({'type': 'token', 'token': token}, ensure_ascii=False)}\n\n".encode()
+    yield DONE_FRAME
+
+
+async def _events(tokens: list[str], interval: float):
+    async for token in _model(tokens, interval):
+        yield token
+    yield DONE_FRAME
+
+
+async def _measure(label: str, stream) -> None:
+    frames = written = 0
+    first = None
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    async for data in stream:
+        if first is None:
+            first = time.perf_counter() - wall_start
+        frames += 1
+        written += len(data)
+    cpu = time.process_time() - cpu_start
+    print(
+        f"{label:<22} frames={frames:6d}  bytes={written:8d}  "
+        f"cpu={cpu * 1000:7.2f} ms  first frame={first * 1000:6.2f} ms"
+    )
+
+
+async def main(count: int, interval: float) -> None:
+    tokens = _tokens(count)
+    print(f"{len(tokens)} tokens, one every {interval * 1000:.1f} ms")
+    await _measure("before (per token)", _legacy(tokens, interval))
+    for window_ms, max_bytes in [(0, 0), (20, 512), (30, 512), (50, 512), (50, 64)]:
+        stream = coalesce_tokens(_events(tokens, interval), window_ms / 1000, max_bytes)
+        await _measure(f"after {window_ms:>2} ms / {max_bytes:>3} B", stream)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--interval", type=float, default=2, help="ms between model tokens")
+    args = parser.parse_args()
+    asyncio.run(main(args.tokens, args.interval / 1000))
@@ -0,0 +1,134 @@
+"""
+Title strategy comparison — local extractive titles vs the title LLM.
+
+Scores both strategies on a fixed set of first turns with hand-written
+reference titles:
+
+  quality  token F1 against the reference (lowercased, stopwords removed)
+  words    mean title length; titles over 6 words are counted as violations
+  cost     mean latency per title and approximate LLM tokens per title
+
+The local strategy needs nothing. The LLM strategy calls Groq and only
+runs with --llm (GROQ_API_KEY must be set).
+Run from Backend/ with: python -m benchmarks.title_quality [--llm]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from graph.agents import title_agent
+from graph.agents.title_agent import MAX_TITLE_WORDS, local_conversation_title
+from graph.history_window import count_tokens
+from graph.prompts import TITLE_AGENT_PROMPT
+
+# (first query, first answer, reference title)
+SAMPLES = [
+    ("How do I reverse a linked list in Python?",
+     "Iterate through the list and flip each node's next pointer; keep track of the previous node.",
+     "Reverse Linked List in Python"),
+    ("tell me a joke about cats",
+     "Why did the cat sit on the computer? To keep an eye on the mouse!",
+     "Cat Joke"),
+    ("What is the area of a circle with radius 3?",
+     "The area of the circle is **28.27** square units.",
+     "Circle Area Calculation"),
+    ("Explain the difference between TCP and UDP",
+     "TCP is connection-oriented and reliable; UDP is connectionless and faster but unreliable.",
+     "TCP vs UDP Differences"),
+    ("what is 12 * 4 + sqrt(81)",
+     "12 * 4 + sqrt(81) = **57**",
+     "Arithmetic Calculation"),
+    ("Can you help me write a cover letter for a data analyst job?",
+     "Sure! Here is a cover letter tailored to a data analyst role highlighting SQL and Python skills.",
+     "Data Analyst Cover Letter"),
+    ("What are good exercises for lower back pain?",
+     "Gentle stretches such as cat-cow, bird-dog and pelvic tilts can relieve lower back pain.",
+     "Lower Back Pain Exercises"),
+    ("how does photosynthesis work",
+     "Photosynthesis converts light energy into chemical energy. Photosynthesis happens in chloroplasts.",
+     "How Photosynthesis Works"),
+    ("Recommend some sci-fi books for a beginner",
+     "Try The Martian, Ender's Game and The Hitchhiker's Guide to the Galaxy.",
+     "Sci-Fi Book Recommendations"),
+    ("hi",
+     "Hello! I'm Nova. I can help with math problems, jokes and general questions.",
+     "Greeting"),
+]
+
+
+def _terms(text: str) -> set[str]:
+    return {
+        t.lower() for t in title_agent._WORD.findall(text)
+        if t.lower() not in title_agent._STOPWORDS
+    }
+
+
+def _f1(predicted: str, reference: str) -> float:
+    pred, ref = _terms(predicted), _terms(reference)
+    if not pred or not ref:
+        return float(pred == ref)
+    overlap = len(pred & ref)
+    if overlap == 0:
+        return 0.0
+    precision, recall = overlap / len(pred), overlap / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+
+def _report(label: str, titles: list[str], latencies: list[float], tokens: list[int]) -> None:
+    scores = [_f1(t, ref) for t, (_, _, ref) in zip(titles, SAMPLES)]
+    lengths = [len(t.split()) for t in titles]
+    print(
+        f"{label:<6} F1={statistics.mean(scores):.2f}  words={statistics.mean(lengths):.1f}  "
+        f">{MAX_TITLE_WORDS} words={sum(n > MAX_TITLE_WORDS for n in lengths)}  "
+        f"latency={statistics.mean(latencies) * 1000:9.3f} ms  tokens={statistics.mean(tokens):6.1f}"
+    )
+
+
+def _run_local(repeat: int) -> list[str]:
+    titles, latencies = [], []
+    for query, answer, _ in SAMPLES:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            title = local_conversation_title(query, answer)
+        latencies.append((time.perf_counter() - start) / repeat)
+        titles.append(title)
+    _report("local", titles, latencies, [0] * len(SAMPLES))
+    return titles
+
+
+async def _run_llm() -> list[str]:
+    from graph.llm import title_llm
+
+    title_agent.configure(title_llm)
+    titles, latencies, tokens = [], [], []
+    for query, answer, _ in SAMPLES:
+        start = time.perf_counter()
+        title = await title_agent.generate_conversation_title(query, answer)
+        latencies.append(time.perf_counter() - start)
+        titles.append(title)
+        prompt = f"{TITLE_AGENT_PROMPT}\nUser message: {query[:300]}\nAssistant reply: {answer[:300]}"
+        tokens.append(count_tokens(prompt) + count_tokens(title))
+    _report("llm", titles, latencies, tokens)
+    return titles
+
+
+async def main(use_llm: bool, repeat: int) -> None:
+    print(f"{len(SAMPLES)} first turns")
+    local = _run_local(repeat)
+    llm = await _run_llm() if use_llm else None
+
+    print()
+    for i, (query, _, reference) in enumerate(SAMPLES):
+        line = f"{query[:40]:<40} | ref: {reference:<30} | local: {local[i]}"
+        if llm is not None:
+            line += f" | llm: {llm[i]}"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--llm", action="store_true", help="also score the Groq title LLM")
+    parser.add_argument("--repeat", type=int, default=1000, help="local calls per sample for timing")
+    args = parser.parse_args()
+    asyncio.run(main(args.llm, args.repeat))
@@ -0,0 +1,69 @@
+"""
+Tool-call latency benchmark — SSE transport vs in-process tools.
+
+Calls each math tool repeatedly through the LangChain tool interface, the
+same way ToolNode does, and reports per-call latency for both modes.
+The SSE mode needs the math server running:
+
+    python mcp_servers/math_mcp_server.py
+
+Run from Backend/ with: python -m benchmarks.tool_call_latency
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+
+from benchmarks._util import p99
+from core import Settings
+from graph.mcp_client import MCP_SERVERS, load_local_tools
+
+CALLS = [
+    ("add", {"a": 2, "b": 3}),
+    ("multiply", {"a": 12.5, "b": 4}),
+    ("sqrt", {"n": 81}),
+    ("calculate_area_circle", {"radius": 3}),
+]
+
+
+async def _measure(label: str, tools, iterations: int) -> None:
+    by_name = {t.name: t for t in tools}
+    # Warm-up so connection setup is not counted
+    await by_name["add"].ainvoke({"a": 1, "b": 1})
+
+    samples = []
+    for _ in range(iterations):
+        for name, args in CALLS:
+            start = time.perf_counter()
+            await by_name[name].ainvoke(args)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    print(
+        f"{label:<6} calls={len(samples):5d}  mean={statistics.mean(samples):8.3f} ms  "
+        f"p50={samples[len(samples) // 2]:8.3f} ms  p99={p99(samples):8.3f} ms"
+    )
+
+
+async def main(iterations: int, skip_sse: bool) -> None:
+    await _measure("local", await load_local_tools(MCP_SERVERS["math"]["module"]), iterations)
+
+    if skip_sse:
+        return
+    client = MultiServerMCPClient({"math": {"url": Settings.MCP_MATH_URL, "transport": "sse"}})
+    try:
+        tools = await client.get_tools()
+    except Exception as exc:
+        print(f"sse    skipped — could not reach {Settings.MCP_MATH_URL}: {exc}")
+        return
+    await _measure("sse", tools, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--skip-sse", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.skip_sse))
@@ -1,4 +1,5 @@
 from .database import engine, Base, get_async_session
 from .settings import Settings
 from .logging_config import setup_logging
-
+from .metrics import metrics
+from .cache import TTLCache
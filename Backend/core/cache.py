@@ -0,0 +1,58 @@
+"""
+TTLCache — bounded in-process LRU cache with per-entry expiry.
+
+Intended for use from the event loop (no locking). Hits, misses and
+evictions are counted in core.metrics under cache.<name>.*.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from core.metrics import metrics
+
+_MISSING = object()
+
+
+class TTLCache:
+
+    def __init__(self, name: str, maxsize: int, ttl: float | None = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value and mark it most-recently used."""
+        entry = self._data.get(key, _MISSING)
+        if entry is not _MISSING:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                metrics.incr(f"cache.{self.name}.hit")
+                return value
+            del self._data[key]
+            metrics.incr(f"cache.{self.name}.expired")
+        metrics.incr(f"cache.{self.name}.miss")
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store `value`, evicting least-recently used entries past maxsize."""
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            metrics.incr(f"cache.{self.name}.evicted")
+
+    def pop(self, key: Hashable) -> Any:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,6 +1,13 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
+from core.metrics import metrics
 from core.settings import Settings
 
 DATABASE_URL = f"mysql+aiomysql://{Settings.USER}:{Settings.PASSWORD}@{Settings.HOST}:{Settings.PORT}/{Settings.DATABASE}"
@@ -8,10 +15,71 @@ engine = create_async_engine(url=DATABASE_URL, echo=False)
 async_session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
 
 
+# Pool metrics: db.pool.checkout_ms is how long each connection stays checked
+# out; db.pool.in_use is the number checked out, sampled at every checkout
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    connection_record.info["checked_out_at"] = time.perf_counter()
+    metrics.observe("db.pool.in_use", engine.sync_engine.pool.checkedout())
+
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    checked_out_at = connection_record.info.pop("checked_out_at", None)
+    if checked_out_at is not None:
+        metrics.observe("db.pool.checkout_ms", (time.perf_counter() - checked_out_at) * 1000)
+
+
 class Base(DeclarativeBase):
     pass
 
 
+class RoundTrips:
+    """Statements and commits sent to the database inside count_round_trips()."""
+
+    def __init__(self):
+        self.count = 0
+
+
+# Active counter for the current task; SQLAlchemy's greenlets inherit it
+_round_trips: ContextVar[RoundTrips | None] = ContextVar("db_round_trips", default=None)
+
+
+@contextmanager
+def count_round_trips() -> Iterator[RoundTrips]:
+    """Count round trips in the block; nested counters also add to the outer one."""
+    outer = _round_trips.get()
+    trips = RoundTrips()
+    token = _round_trips.set(trips)
+    try:
+        yield trips
+    finally:
+        _round_trips.reset(token)
+        if outer is not None:
+            outer.count += trips.count
+
+
+def _on_execute(conn, cursor, statement, parameters, context, executemany):
+    trips = _round_trips.get()
+    if trips is not None:
+        trips.count += 1
+
+
+def _on_commit(conn):
+    trips = _round_trips.get()
+    if trips is not None:
+        trips.count += 1
+
+
+def track_round_trips(sync_engine) -> None:
+    """Feed count_round_trips() from an engine's statements and commits."""
+    event.listen(sync_engine, "before_cursor_execute", _on_execute)
+    event.listen(sync_engine, "commit", _on_commit)
+
+
+track_round_trips(engine.sync_engine)
+
+
 async def get_async_session():
     async with async_session_maker() as session:
         try:
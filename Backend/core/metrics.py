@@ -0,0 +1,59 @@
+"""
+In-process metrics registry — counters and timing summaries.
+
+Values live in the worker's memory only; they reset on restart and are
+exposed as a JSON snapshot via GET /metrics.
+"""
+import threading
+from collections import defaultdict
+
+
+class Metrics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = defaultdict(float)
+        self._summaries: dict[str, dict[str, float]] = {}
+
+    def incr(self, name: str, value: float = 1) -> None:
+        """Increase counter `name` by `value`."""
+        with self._lock:
+            self._counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record one sample (e.g. a duration in ms) for summary `name`."""
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                self._summaries[name] = {"count": 1, "sum": value, "max": value}
+                return
+            summary["count"] += 1
+            summary["sum"] += value
+            summary["max"] = max(summary["max"], value)
+
+    def get(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def mean(self, name: str) -> float | None:
+        """Mean of summary `name`, or None before its first sample."""
+        with self._lock:
+            summary = self._summaries.get(name)
+            return summary["sum"] / summary["count"] if summary else None
+
+    def snapshot(self) -> dict:
+        """Return a copy of all counters and summaries (with mean)."""
+        with self._lock:
+            summaries = {
+                name: {**s, "mean": s["sum"] / s["count"]}
+                for name, s in self._summaries.items()
+            }
+            return {"counters": dict(self._counters), "summaries": summaries}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+
+metrics = Metrics()
@@ -16,4 +16,100 @@ class Settings :
     ALGORITHM = os.getenv("ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
     REFRESH_TOKEN_EXPIRE_MINUTES = os.getenv("REFRESH_TOKEN_EXPIRE_MINUTES")
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
\ No newline at end of file
+    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+    # Rule-based pre-router: decide locally when score >= threshold (mcp)
+    # or <= 1 - threshold (chat); anything in between goes to the LLM.
+    # Set to 1 to always use the LLM classifier.
+    PRE_ROUTER_THRESHOLD = float(os.getenv("PRE_ROUTER_THRESHOLD", "0.85"))
+
+    # LRU cache for LLM routing decisions
+    ROUTING_CACHE_SIZE = int(os.getenv("ROUTING_CACHE_SIZE", "1024"))
+    ROUTING_CACHE_TTL_SECONDS = float(os.getenv("ROUTING_CACHE_TTL_SECONDS", "600"))
+
+    # Stream the chat LLM while the classifier decides; discarded if it picks mcp
+    SPECULATIVE_CHAT = os.getenv("SPECULATIVE_CHAT", "false").lower() == "true"
+
+    # MCP math server: "sse" (remote server at MCP_MATH_URL) or "local" (in-process)
+    MCP_MATH_TRANSPORT = os.getenv("MCP_MATH_TRANSPORT", "sse")
+    MCP_MATH_URL = os.getenv("MCP_MATH_URL", "http://localhost:8001/sse")
+    MCP_POOL_SIZE = int(os.getenv("MCP_POOL_SIZE", "2"))
+    MCP_MAX_CONCURRENT_CALLS = int(os.getenv("MCP_MAX_CONCURRENT_CALLS", "16"))
+    MCP_HEALTH_INTERVAL_SECONDS = float(os.getenv("MCP_HEALTH_INTERVAL_SECONDS", "15"))
+    MCP_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("MCP_ACQUIRE_TIMEOUT_SECONDS", "10"))
+
+    # Result cache for deterministic MCP tools (TTL 0 = never expire)
+    TOOL_CACHE_SIZE = int(os.getenv("TOOL_CACHE_SIZE", "4096"))
+    TOOL_CACHE_TTL_SECONDS = float(os.getenv("TOOL_CACHE_TTL_SECONDS", "0"))
+
+    # Parallel tool execution per LLM turn
+    TOOL_MAX_PARALLEL_CALLS = int(os.getenv("TOOL_MAX_PARALLEL_CALLS", "8"))
+    TOOL_CALL_TIMEOUT_SECONDS = float(os.getenv("TOOL_CALL_TIMEOUT_SECONDS", "15"))
+    # Window for coalescing concurrent calls into one MCP batch request (0 = off)
+    MCP_BATCH_WINDOW_MS = float(os.getenv("MCP_BATCH_WINDOW_MS", "2"))
+
+    # Recent messages loaded per turn (and cached per session); the token
+    # budgets below decide how many of them each node actually receives
+    HISTORY_CACHE_MESSAGES = int(os.getenv("HISTORY_CACHE_MESSAGES", "40"))
+    HISTORY_CACHE_MAX_BYTES = int(os.getenv("HISTORY_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    CHAT_HISTORY_TOKEN_BUDGET = int(os.getenv("CHAT_HISTORY_TOKEN_BUDGET", "3000"))
+    MCP_HISTORY_TOKEN_BUDGET = int(os.getenv("MCP_HISTORY_TOKEN_BUDGET", "1500"))
+    HISTORY_MESSAGE_MAX_TOKENS = int(os.getenv("HISTORY_MESSAGE_MAX_TOKENS", "800"))
+
+    # Rolling summaries: refresh once this many messages are unsummarized,
+    # always leaving the newest SUMMARY_KEEP_RECENT out of the summary
+    SUMMARY_TRIGGER_MESSAGES = int(os.getenv("SUMMARY_TRIGGER_MESSAGES", "20"))
+    SUMMARY_KEEP_RECENT = int(os.getenv("SUMMARY_KEEP_RECENT", "8"))
+
+    # Cached authenticated principals (id, email, role) per user id
+    PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+    PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+
+    # Refresh-token garbage collection: expired rows, and revoked rows older
+    # than the retention (kept that long for reuse detection), are deleted
+    # every interval in batches of at most TOKEN_GC_BATCH_SIZE rows
+    TOKEN_GC_INTERVAL_SECONDS = float(os.getenv("TOKEN_GC_INTERVAL_SECONDS", "3600"))
+    TOKEN_GC_BATCH_SIZE = int(os.getenv("TOKEN_GC_BATCH_SIZE", "500"))
+    TOKEN_GC_REVOKED_RETENTION_MINUTES = float(os.getenv("TOKEN_GC_REVOKED_RETENTION_MINUTES", "1440"))
+
+    # Argon2 cost parameters (memory in KiB); stored hashes made with other
+    # values are upgraded on the next successful login
+    ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+    ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+    ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "4"))
+    # Password hashing pool: worker threads and how many calls may wait;
+    # beyond that, login/register answer 503
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "32"))
+
+    # Verified access-token claims cached per worker until each token's exp
+    ACCESS_TOKEN_CACHE_SIZE = int(os.getenv("ACCESS_TOKEN_CACHE_SIZE", "10000"))
+
+    # Background job queue for post-turn work (titles, summaries)
+    JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_QUEUE_MAX_DEPTH = int(os.getenv("JOB_QUEUE_MAX_DEPTH", "256"))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    JOB_RETRY_BACKOFF_SECONDS = float(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "1"))
+    # Session titles: "llm" (LLM only), "local" (extractive only) or "hybrid"
+    # (local placeholder at once, replaced by an LLM title for a
+    # TITLE_LLM_SAMPLE_RATE fraction of new sessions)
+    TITLE_STRATEGY = os.getenv("TITLE_STRATEGY", "hybrid").lower()
+    TITLE_LLM_SAMPLE_RATE = float(os.getenv("TITLE_LLM_SAMPLE_RATE", "1.0"))
+    # How long a stream stays open after `done` to push the session title
+    TITLE_PUSH_TIMEOUT_SECONDS = float(os.getenv("TITLE_PUSH_TIMEOUT_SECONDS", "10"))
+
+    # SSE token coalescing defaults (per-request override via query params);
+    # a window of 0 sends every token as its own frame
+    SSE_COALESCE_WINDOW_MS = int(os.getenv("SSE_COALESCE_WINDOW_MS", "30"))
+    SSE_COALESCE_MAX_BYTES = int(os.getenv("SSE_COALESCE_MAX_BYTES", "512"))
+    # How often a stream checks for a disconnected client, and whether the
+    # answer produced until then is saved (source "partial")
+    SSE_DISCONNECT_POLL_SECONDS = float(os.getenv("SSE_DISCONNECT_POLL_SECONDS", "0.5"))
+    STREAM_PERSIST_PARTIAL = os.getenv("STREAM_PERSIST_PARTIAL", "true").lower() == "true"
+    # Resumable streams: how long an abandoned run keeps generating for a
+    # reconnect (0 cancels on disconnect), how long a finished run stays
+    # replayable, and the replay buffer limits per run and per process
+    STREAM_RESUME_GRACE_SECONDS = float(os.getenv("STREAM_RESUME_GRACE_SECONDS", "15"))
+    STREAM_RUN_RETENTION_SECONDS = float(os.getenv("STREAM_RUN_RETENTION_SECONDS", "60"))
+    STREAM_RUN_MAX_BYTES = int(os.getenv("STREAM_RUN_MAX_BYTES", str(256 * 1024)))
+    STREAM_RUNS_MAX_BYTES = int(os.getenv("STREAM_RUNS_MAX_BYTES", str(32 * 1024 * 1024)))
@@ -3,18 +3,32 @@ Graph package — public API.
 
 Module structure:
   state.py          AgentState
-  llm.py            LLM instances (context, chat, mcp, title)
-  mcp_client.py     MCP SSE server tool setup
+  history_window.py token-budgeted history selection per node
+  llm.py            LLM instances (context, chat, mcp, title, summary)
+  mcp_client.py     MCP tool setup (SSE or in-process)
+  mcp_pool.py       pooled, health-checked MCP client sessions
+  tool_cache.py     result cache for deterministic tools
   agents/
+    pre_router      local rule-based intent scoring
     context_agent   query classifier + router
     chat_agent      general chat node
     mcp_agent       tool-calling node (math + joke)
-    title_agent     conversation title generator
+    tool_agent      parallel tool execution node
+    title_agent     conversation title generator (LLM or local extractive)
+    summary_agent   rolling conversation summary
   graph.py          LangGraph wiring (build_graph)
+  speculative.py    speculative chat streaming while classifying
+  fast_math.py      local evaluator for self-contained math queries
 """
 from .state import AgentState
-from .mcp_client import setup_tools
+from .mcp_client import setup_tools, close_tools
 from .graph import build_graph
-from .agents.title_agent import generate_conversation_title
+from .speculative import speculative_events
+from .fast_math import solve_math
+from .agents.title_agent import generate_conversation_title, local_conversation_title
+from .agents.summary_agent import summarize_conversation
 
-__all__ = ["AgentState", "setup_tools", "build_graph", "generate_conversation_title"]
+__all__ = [
+    "AgentState", "setup_tools", "close_tools", "build_graph", "speculative_events", "solve_math",
+    "generate_conversation_title", "local_conversation_title", "summarize_conversation",
+]
@@ -3,9 +3,11 @@ Chat agent — handles general conversational queries with history context.
 """
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
+from core import Settings
+from graph.history_window import select_history
 from graph.llm import chat_llm
 from graph.state import AgentState
-from graph.prompts import CHAT_AGENT_PROMPT
+from graph.prompts import CHAT_AGENT_PROMPT, SUMMARY_CONTEXT_PROMPT
 
 
 def _history_to_messages(history: list[dict]) -> list:
@@ -18,15 +20,22 @@ def _history_to_messages(history: list[dict]) -> list:
     return msgs
 
 
-async def chat_node(state: AgentState) -> AgentState:
-    """Respond to the user using prior conversation as context."""
-    messages = (
-        [
-            SystemMessage(content=CHAT_AGENT_PROMPT)
-        ]
-        + _history_to_messages(state.history)
+def build_chat_messages(state: AgentState) -> list:
+    """System prompt + summary + prior conversation (within budget) + the new query."""
+    history = select_history(state.history, Settings.CHAT_HISTORY_TOKEN_BUDGET, "chat_node")
+    system = [SystemMessage(content=CHAT_AGENT_PROMPT)]
+    if state.summary:
+        system.append(SystemMessage(content=SUMMARY_CONTEXT_PROMPT.format(summary=state.summary)))
+    return (
+        system
+        + _history_to_messages(history)
         + [HumanMessage(content=state.query)]
     )
+
+
+async def chat_node(state: AgentState) -> AgentState:
+    """Respond to the user using prior conversation as context."""
+    messages = build_chat_messages(state)
     response = await chat_llm.ainvoke(messages)
     return state.model_copy(
         update={"answer": response.content, "messages": [response]}
@@ -1,33 +1,103 @@
 """
 Context agent — classifies user query as 'mcp' (needs tools) or 'chat'.
-Uses a fast, small LLM with a tight token budget.
+Obvious intents are decided locally by the pre-router and repeat inputs
+are served from a routing cache; only new ambiguous queries reach the
+fast, small LLM with a tight token budget.
+The classifier chain is built once by build_graph() via configure().
 """
+import hashlib
+import re
+
 from langchain_core.prompts import ChatPromptTemplate
 
-from graph.llm import context_llm
+from core import Settings, TTLCache, metrics
+from graph.agents.pre_router import pre_route
 from graph.state import AgentState
 from graph.prompts import CONTEXT_AGENT_PROMPT
 
+# Number of recent messages and max characters of history sent to the classifier
+RECENT_HISTORY_MESSAGES = 4
+MAX_HISTORY_CHARS = 2000
+
+# Module-level reference set by graph.build_graph()
+_context_chain = None
+
+# (normalized query, history hash) -> "chat" | "mcp"
+_routing_cache = TTLCache(
+    "routing",
+    maxsize=Settings.ROUTING_CACHE_SIZE,
+    ttl=Settings.ROUTING_CACHE_TTL_SECONDS,
+)
 
-def context_node(state: AgentState) -> AgentState:
-    """Classify the incoming query."""
-    # Get up to 4 recent messages for context
-    recent_history = state.history[-4:] if state.history else []
-    history_text = "\n".join([f"{h['role'].title()}: {h['content']}" for h in recent_history])
-    if not history_text:
-        history_text = "No prior context."
 
+def configure(llm) -> None:
+    """Called by build_graph() to build the classifier chain once."""
+    global _context_chain
     prompt = ChatPromptTemplate.from_messages(
         [
             ("system", CONTEXT_AGENT_PROMPT),
             ("human", "Recent context:\n{history}\n\nUser query: {input}"),
         ]
     )
-    chain = prompt | context_llm
-    response = chain.invoke({"input": state.query, "history": history_text})
+    _context_chain = prompt | llm
+
+
+def _recent_history_text(history: list[dict]) -> str:
+    """Render the last few messages, keeping only the newest MAX_HISTORY_CHARS."""
+    recent_history = history[-RECENT_HISTORY_MESSAGES:] if history else []
+    history_text = "\n".join([f"{h['role'].title()}: {h['content']}" for h in recent_history])
+    if not history_text:
+        return "No prior context."
+    if len(history_text) > MAX_HISTORY_CHARS:
+        history_text = "…" + history_text[-MAX_HISTORY_CHARS:]
+    return history_text
+
+
+def _cache_key(query: str, history_text: str) -> tuple[str, str]:
+    normalized = re.sub(r"\s+", " ", query.lower()).strip().rstrip("?!. ")
+    history_hash = hashlib.sha1(history_text.encode()).hexdigest()
+    return normalized, history_hash
+
+
+def route_locally(query: str, history: list[dict]) -> str | None:
+    """Return 'mcp' or 'chat' from the pre-router or routing cache, else None."""
+    intent = pre_route(query, history)
+    if intent is not None:
+        metrics.incr(f"router.rule.{intent}")
+        return intent
+
+    intent = _routing_cache.get(_cache_key(query, _recent_history_text(history)))
+    if intent is not None:
+        metrics.incr("router.cache")
+    return intent
+
+
+async def classify_with_llm(query: str, history: list[dict]) -> str:
+    """Ask the classifier LLM and cache its answer."""
+    history_text = _recent_history_text(history)
+    key = _cache_key(query, history_text)
+    metrics.incr("router.llm")
+    response = await _context_chain.ainvoke({"input": query, "history": history_text})
     intent = response.content.strip().lower()
     if intent not in ["chat", "mcp"]:
         intent = "chat"
+    _routing_cache.set(key, intent)
+    return intent
+
+
+async def classify(query: str, history: list[dict]) -> str:
+    """Return 'mcp' or 'chat' via pre-router, routing cache, then the LLM."""
+    intent = route_locally(query, history)
+    if intent is not None:
+        return intent
+    return await classify_with_llm(query, history)
+
+
+async def context_node(state: AgentState) -> AgentState:
+    """Classify the incoming query (skipped when the caller already routed it)."""
+    if state.node is not None:
+        return state
+    intent = await classify(state.query, state.history)
     return state.model_copy(update={"node": intent})
 
 
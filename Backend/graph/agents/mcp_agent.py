@@ -8,9 +8,11 @@ from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 logger = logging.getLogger(__name__)
 
+from core import Settings
+from graph.history_window import select_history
 from graph.state import AgentState
 from langgraph.constants import END
-from graph.prompts import MCP_AGENT_PROMPT
+from graph.prompts import MCP_AGENT_PROMPT, SUMMARY_CONTEXT_PROMPT
 
 # Module-level reference set by graph.build_graph()
 _mcp_llm_with_tools = None
@@ -39,10 +41,12 @@ async def mcp_node(state: AgentState) -> dict:
     """
     messages_to_add = []
     if not state.messages:
-        history_messages = _history_to_messages(state.history)
-        messages_to_add = [
-            SystemMessage(content=MCP_AGENT_PROMPT)
-        ] + history_messages + [HumanMessage(content=state.query)]
+        history = select_history(state.history, Settings.MCP_HISTORY_TOKEN_BUDGET, "mcp_node")
+        history_messages = _history_to_messages(history)
+        system = [SystemMessage(content=MCP_AGENT_PROMPT)]
+        if state.summary:
+            system.append(SystemMessage(content=SUMMARY_CONTEXT_PROMPT.format(summary=state.summary)))
+        messages_to_add = system + history_messages + [HumanMessage(content=state.query)]
 
     # Pass all existing messages + any newly constructed ones to the LLM
     input_messages = list(state.messages) + messages_to_add
@@ -0,0 +1,85 @@
+"""
+Pre-router — local rule-based intent scoring in front of the context agent.
+
+Scores how likely a query needs the math tools (0.0 = chat, 1.0 = mcp)
+from the query text and recent history. Confident scores are routed
+directly; only the ambiguous band falls through to the LLM classifier.
+"""
+import re
+
+from core import Settings
+
+# "12*4", "3 + 5", "2^10", "7 % 3"
+_OPERATOR_EXPR = re.compile(r"[\d)]\s*(?:\*\*|[+*^%×÷])\s*[\d(.]")
+# "7 - 2", "10/5" — but also ranges, ratios and phone numbers ("3-4 sentences",
+# "1939-1945", "the 80/20 rule", "24/7", "555-1234"), so on its own this is
+# only ambiguous; an "=" or a math verb/function makes it arithmetic
+_DASH_SLASH_EXPR = re.compile(r"[\d)]\s*[-/]\s*[\d(.]")
+_DATE_LIKE = re.compile(r"\b\d{1,4}[-/]\d{1,2}[-/]\d{1,4}\b")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_MATH_FUNCTION = re.compile(
+    r"\b(?:sqrt|square root|to the power|power of|squared|cubed|modulus|remainder|area of)\b"
+)
+_MATH_VERB = re.compile(
+    r"\b(?:calculate|compute|evaluate|solve|add|subtract|multiply|divide|divided by|"
+    r"sum|product|plus|minus|times|difference)\b"
+)
+_FOLLOW_UP = re.compile(
+    r"^(?:and|what about|how about|now|then|also|what if)\b|\b(?:it|that|this|result|answer)\b"
+)
+
+RECENT_HISTORY_MESSAGES = 4
+
+
+def confirms_arithmetic(text: str) -> bool:
+    """Whether an "=" or a math verb/function marks a bare "7 - 2" / "10/5" as arithmetic."""
+    return "=" in text or bool(_MATH_VERB.search(text) or _MATH_FUNCTION.search(text))
+
+
+def _text_score(text: str) -> float:
+    """Score a single piece of text on its own, without context."""
+    numbers = _NUMBER.findall(text)
+    if _DATE_LIKE.search(text):
+        dash_slash = False
+    else:
+        if _OPERATOR_EXPR.search(text):
+            return 0.95
+        dash_slash = bool(_DASH_SLASH_EXPR.search(text))
+        if dash_slash and "=" in text:
+            return 0.95
+    if _MATH_FUNCTION.search(text):
+        return 0.9 if numbers else 0.6
+    if _MATH_VERB.search(text):
+        if len(numbers) >= 2:
+            return 0.9
+        return 0.7 if numbers else 0.5
+    if dash_slash:
+        return 0.6
+    if numbers:
+        return 0.4
+    return 0.05
+
+
+def score_query(query: str, history: list[dict]) -> float:
+    """Return the probability-like score that `query` should go to mcp."""
+    text = query.lower()
+    score = _text_score(text)
+
+    # Follow-ups ("and for radius 5?") inherit intent from a math conversation,
+    # but never confidently enough to skip the LLM on their own.
+    recent = history[-RECENT_HISTORY_MESSAGES:] if history else []
+    if score < 0.9 and _FOLLOW_UP.search(text):
+        if any(_text_score(h["content"].lower()) >= 0.9 for h in recent):
+            score = max(score, 0.5)
+    return score
+
+
+def pre_route(query: str, history: list[dict]) -> str | None:
+    """Return 'mcp' or 'chat' when confident, or None to defer to the LLM."""
+    threshold = Settings.PRE_ROUTER_THRESHOLD
+    score = score_query(query, history)
+    if score >= threshold:
+        return "mcp"
+    if score <= 1 - threshold:
+        return "chat"
+    return None
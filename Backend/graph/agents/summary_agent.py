@@ -0,0 +1,39 @@
+"""
+Summary agent — folds older conversation turns into a running summary.
+
+Run in the background by AskService once a session's unsummarized tail
+grows past a threshold; the nodes then receive the summary plus the recent
+tail instead of the raw history. The chain is built once by build_graph()
+via configure().
+"""
+from langchain_core.prompts import ChatPromptTemplate
+
+from graph.prompts import SUMMARY_AGENT_PROMPT
+
+# Module-level reference set by graph.build_graph()
+_summary_chain = None
+
+# Cap on the transcript handed to the summarizer per refresh
+MAX_TRANSCRIPT_CHARS = 12000
+
+
+def configure(llm) -> None:
+    """Called by build_graph() to build the summary chain once."""
+    global _summary_chain
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", SUMMARY_AGENT_PROMPT),
+            ("human", "Previous summary:\n{summary}\n\nNewer messages:\n{transcript}"),
+        ]
+    )
+    _summary_chain = prompt | llm
+
+
+async def summarize_conversation(previous_summary: str | None, messages: list[dict]) -> str:
+    """Return an updated summary covering `previous_summary` plus `messages`."""
+    transcript = "\n".join(f"{m['role'].title()}: {m['content']}" for m in messages)
+    response = await _summary_chain.ainvoke({
+        "summary": previous_summary or "None yet.",
+        "transcript": transcript[-MAX_TRANSCRIPT_CHARS:],
+    })
+    return response.content.strip()
@@ -3,20 +3,92 @@ Title agent — generates a short, descriptive name for a new conversation.
 
 Called once after the first turn of a session so the user sees a meaningful
 title (e.g. "Circle Area Calculation") instead of "New Conversation".
+The title chain is built once by build_graph() via configure().
+
+local_conversation_title() is the LLM-free alternative: the query's
+keywords in their original order, topped up from the answer when the query
+has too few. It runs in microseconds and serves as the only strategy or as
+an instant placeholder the LLM title later replaces (Settings.TITLE_STRATEGY).
 """
+import re
+from collections import Counter
+
 from langchain_core.prompts import ChatPromptTemplate
 
-from graph.llm import title_llm
 from graph.prompts import TITLE_AGENT_PROMPT
 
+# Module-level reference set by graph.build_graph()
+_title_chain = None
 
-async def generate_conversation_title(query: str, answer: str) -> str:
-    """
-    Generate a concise title (≤ 6 words) for a conversation given the first
-    human query and the assistant's answer.
+MAX_TITLE_WORDS = 6
+DEFAULT_TITLE = "New Conversation"
 
-    Returns a plain string without quotes or punctuation.
-    """
+# Any script: starts with a letter, may contain digits, + # ' ’ - inside
+_WORD = re.compile(r"[^\W\d_](?:[\w+#'’-]*[\w+#])?")
+_ARITHMETIC = re.compile(r"\d\s*[-+*/^%x×÷]\s*\d|sqrt")
+_STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have
+having he her here hers him his how i if in into is it its itself just me more most my no nor not
+now of off on once only or other our ours out over own same she should so some such than that the
+their theirs them then there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your yours
+please tell explain give show help want know need like make get let hi hello hey thanks thank
+something anything stuff thing things way ok okay sure also really much many sqrt
+what's who's where's when's how's why's it's that's there's here's let's i'm i've i'd i'll
+you're you've you'd you'll we're they're don't doesn't didn't can't won't isn't aren't
+""".split())
+# Kept between two keywords that are one word apart ("joke about cats")
+_CONNECTORS = frozenset({"about", "of", "in", "for", "with", "to", "vs", "and", "on", "from"})
+
+
+def _keyword(token: str) -> bool:
+    return len(token) > 1 and token.lower().replace("’", "'") not in _STOPWORDS
+
+
+def _title_case(token: str) -> str:
+    # Keep deliberate casing (API, FastAPI, iPhone); capitalize the rest
+    return token if any(c.isupper() for c in token) else token.capitalize()
+
+
+def local_conversation_title(query: str, answer: str) -> str:
+    """Extractive title (≤ MAX_TITLE_WORDS words) from the first query and answer."""
+    tokens = _WORD.findall(query[:300])
+    words: list[str] = []
+    seen: set[str] = set()
+    previous = None
+    for i, token in enumerate(tokens):
+        if not _keyword(token) or token.lower() in seen:
+            continue
+        connector = previous is not None and i - previous == 2 and tokens[i - 1].lower() in _CONNECTORS
+        if len(words) + 1 + connector > MAX_TITLE_WORDS:
+            break
+        if connector:
+            words.append(tokens[i - 1].lower())
+        words.append(_title_case(token))
+        seen.add(token.lower())
+        previous = i
+
+    if len(seen) < 2:
+        # Too little in the query — add the answer's recurring keywords
+        counts = Counter(
+            t.lower() for t in _WORD.findall(answer[:1000]) if len(t) > 3 and _keyword(t)
+        )
+        for word, count in counts.most_common():
+            if count < 2 or len(seen) >= 3 or len(words) >= MAX_TITLE_WORDS:
+                break
+            if word not in seen:
+                words.append(_title_case(word))
+                seen.add(word)
+
+    if not words:
+        return "Calculation" if _ARITHMETIC.search(query) else DEFAULT_TITLE
+    return " ".join(words)
+
+
+def configure(llm) -> None:
+    """Called by build_graph() to build the title chain once."""
+    global _title_chain
     prompt = ChatPromptTemplate.from_messages(
         [
             ("system", TITLE_AGENT_PROMPT),
@@ -26,8 +98,17 @@ async def generate_conversation_title(query: str, answer: str) -> str:
             ),
         ]
     )
-    chain = prompt | title_llm
-    response = await chain.ainvoke({"query": query[:300], "answer": answer[:300]})
+    _title_chain = prompt | llm
+
+
+async def generate_conversation_title(query: str, answer: str) -> str:
+    """
+    Generate a concise title (≤ 6 words) for a conversation given the first
+    human query and the assistant's answer.
+
+    Returns a plain string without quotes or punctuation.
+    """
+    response = await _title_chain.ainvoke({"query": query[:300], "answer": answer[:300]})
     title = response.content.strip().strip('"').strip("'")
     # Truncate to 80 chars as a safety net
-    return title[:80] if title else "New Conversation"
+    return title[:80] if title else DEFAULT_TITLE
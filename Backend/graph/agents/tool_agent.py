@@ -0,0 +1,80 @@
+"""
+Tool agent — executes every tool call of the last AI message in parallel.
+
+Calls run concurrently under a per-request concurrency limit and a per-call
+timeout; failures and timeouts become error ToolMessages so the MCP LLM can
+recover. Concurrent calls to a pooled MCP server are coalesced into one
+batch round trip by mcp_pool. The tools are set once by build_graph().
+
+Each invocation appends {"tools", "wall_ms", "serial_ms"} to
+AgentState.tool_runs, where serial_ms is the sum of individual call times
+(what the batch would have cost run one after another).
+"""
+import asyncio
+import logging
+import time
+
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+from core import Settings, metrics
+from graph.state import AgentState
+
+logger = logging.getLogger(__name__)
+
+# Module-level reference set by graph.build_graph()
+_tools_by_name: dict = {}
+
+
+def configure(tools) -> None:
+    """Called by build_graph() with the (memoized) tool list."""
+    global _tools_by_name
+    _tools_by_name = {t.name: t for t in tools}
+
+
+async def _run_call(call: dict, config: RunnableConfig, limit: asyncio.Semaphore, durations: list[float]) -> ToolMessage:
+    name = call["name"]
+    tool = _tools_by_name.get(name)
+    if tool is None:
+        return ToolMessage(
+            content=f"Error: {name} is not a valid tool, try one of [{', '.join(_tools_by_name)}].",
+            name=name,
+            tool_call_id=call["id"],
+            status="error",
+        )
+
+    async with limit:
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(
+                tool.ainvoke({**call, "type": "tool_call"}, config),
+                timeout=Settings.TOOL_CALL_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            metrics.incr("tools.timeout")
+            content = f"Error: tool '{name}' timed out after {Settings.TOOL_CALL_TIMEOUT_SECONDS:g}s"
+        except Exception as exc:
+            content = f"Error: {exc!r}\n Please fix your mistakes."
+        finally:
+            durations.append(time.perf_counter() - start)
+    return ToolMessage(content=content, name=name, tool_call_id=call["id"], status="error")
+
+
+async def tool_node(state: AgentState, config: RunnableConfig) -> dict:
+    """Run all pending tool calls concurrently and return their ToolMessages."""
+    calls = state.messages[-1].tool_calls
+    limit = asyncio.Semaphore(Settings.TOOL_MAX_PARALLEL_CALLS)
+    durations: list[float] = []
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_run_call(c, config, limit, durations) for c in calls))
+    wall_ms = (time.perf_counter() - start) * 1000
+    serial_ms = sum(durations) * 1000
+
+    run = {"tools": [c["name"] for c in calls], "wall_ms": round(wall_ms, 2), "serial_ms": round(serial_ms, 2)}
+    metrics.observe("tools.calls_per_turn", len(calls))
+    metrics.observe("tools.wall_ms", wall_ms)
+    metrics.observe("tools.serial_ms", serial_ms)
+    logger.info("Tool calls %s: wall=%.1f ms serial=%.1f ms", run["tools"], wall_ms, serial_ms)
+
+    return {"messages": list(results), "tool_runs": [run]}
@@ -0,0 +1,151 @@
+"""
+Fast math path — answers self-contained arithmetic and area queries locally.
+
+Queries like "what is 12.5 * 4 + sqrt(81)" or "area of a circle with radius 3"
+are evaluated with a whitelisted AST walker over the same functions the math
+MCP server exposes, so no LLM or tool round trip is needed. Anything that is
+not a complete expression returns None and goes through the graph as usual.
+"""
+import ast
+import logging
+import re
+
+from core import metrics
+from graph.agents.pre_router import confirms_arithmetic
+from mcp_servers.math_mcp_server import (
+    add, subtract, multiply, divide, power, modulus, sqrt,
+    calculate_area_circle, calculate_area_rectangle, calculate_area_triangle,
+)
+
+logger = logging.getLogger(__name__)
+
+_BIN_OPS = {
+    ast.Add: add,
+    ast.Sub: subtract,
+    ast.Mult: multiply,
+    ast.Div: divide,
+    ast.Pow: power,
+    ast.Mod: modulus,
+}
+_FUNCTIONS = {"sqrt": sqrt}
+
+# Keep expressions small enough to never be a CPU sink
+MAX_EXPRESSION_CHARS = 200
+MAX_EXPONENT = 1000
+
+_NUM = r"(\d+(?:\.\d+)?)"
+_PREFIX = re.compile(
+    r"^(?:please\s+)?(?:what(?:'s|\s+is)|calculate|compute|evaluate|solve|find|how\s+much\s+is)\s+(?:the\s+)?"
+)
+_EXPRESSION_CHARS = re.compile(r"^[\d\s.+\-*/%()]+$")
+_OPERATOR = re.compile(r"[+\-*/%]|sqrt")
+# Numbers joined only by - or /: phone numbers, ranges, ratios, dates
+# ("555-1234", "1939-1945", "24/7", "3/4/2024") unless confirmed as math
+_DASH_SLASH_ONLY = re.compile(r"^[\d\s.]+(?:[-/][\d\s.]+)+$")
+_AREA_PATTERNS = [
+    (
+        re.compile(rf"^area of (?:a )?circle (?:with |of )?(?:a )?radius (?:of |= ?|is )?{_NUM}(?: units?)?$"),
+        "circle",
+        calculate_area_circle,
+    ),
+    (
+        re.compile(
+            rf"^area of (?:a )?rectangle (?:with )?(?:a )?length (?:of |= ?|is )?{_NUM}"
+            rf"(?:,)? and (?:a )?width (?:of |= ?|is )?{_NUM}(?: units?)?$"
+        ),
+        "rectangle",
+        calculate_area_rectangle,
+    ),
+    (
+        re.compile(rf"^area of (?:a )?rectangle {_NUM} (?:by|x|\*) {_NUM}$"),
+        "rectangle",
+        calculate_area_rectangle,
+    ),
+    (
+        re.compile(
+            rf"^area of (?:a )?triangle (?:with )?(?:a )?base (?:of |= ?|is )?{_NUM}"
+            rf"(?:,)? and (?:a )?height (?:of |= ?|is )?{_NUM}(?: units?)?$"
+        ),
+        "triangle",
+        calculate_area_triangle,
+    ),
+]
+
+
+def _normalize(query: str) -> str:
+    text = re.sub(r"\s+", " ", query.lower()).strip()
+    text = _PREFIX.sub("", text)
+    return text.rstrip(" ?!.=")
+
+
+def _evaluate(node: ast.AST) -> float:
+    """Evaluate a whitelisted expression tree; raise ValueError otherwise."""
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return float(node.value)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = _evaluate(node.operand)
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        left, right = _evaluate(node.left), _evaluate(node.right)
+        if isinstance(node.op, ast.Pow) and abs(right) > MAX_EXPONENT:
+            raise ValueError("Exponent too large")
+        result = _BIN_OPS[type(node.op)](left, right)
+        if not isinstance(result, float):
+            # e.g. a negative base with a fractional exponent gives a complex
+            raise ValueError(f"Non-real result: {result!r}")
+        return result
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        return _FUNCTIONS[node.func.id](_evaluate(node.args[0]))
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+def _format_number(value: float) -> str:
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return f"{value:.10g}"
+
+
+def _solve_expression(text: str, confirmed: bool) -> str | None:
+    expression = text.replace("×", "*").replace("÷", "/").replace("^", "**")
+    expression = re.sub(r"(?<=\d)\s*x\s*(?=\d)", " * ", expression)
+    if len(expression) > MAX_EXPRESSION_CHARS or not _OPERATOR.search(expression):
+        return None
+    if not _EXPRESSION_CHARS.match(expression.replace("sqrt", "")):
+        return None
+    if not confirmed and _DASH_SLASH_ONLY.match(expression):
+        return None
+    tree = ast.parse(expression, mode="eval")
+    if not any(isinstance(node, (ast.BinOp, ast.Call)) for node in ast.walk(tree)):
+        # "-5", "(3)": nothing to compute
+        return None
+    result = _evaluate(tree)
+    return f"{text} = **{_format_number(result)}**"
+
+
+def _solve_area(text: str) -> str | None:
+    for pattern, shape, func in _AREA_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            result = func(*(float(g) for g in match.groups()))
+            return f"The area of the {shape} is **{_format_number(result)}**."
+    return None
+
+
+def solve_math(query: str) -> str | None:
+    """Return a formatted answer for a self-contained math query, else None."""
+    text = _normalize(query)
+    try:
+        answer = _solve_area(text) or _solve_expression(text, confirms_arithmetic(query.lower()))
+    except (SyntaxError, ValueError, ArithmeticError) as exc:
+        logger.debug("Fast math path declined %r: %s", query, exc)
+        answer = None
+    metrics.incr("fast_math.hit" if answer is not None else "fast_math.miss")
+    return answer
@@ -5,13 +5,16 @@ All node logic lives in graph/agents/. This file only handles wiring.
 """
 from langgraph.constants import START, END
 from langgraph.graph import StateGraph
-from langgraph.prebuilt import ToolNode
 
-from graph.agents.context_agent import context_node, context_router
+from graph.agents.context_agent import context_node, context_router, configure as configure_context
 from graph.agents.chat_agent import chat_node
 from graph.agents.mcp_agent import mcp_node, tool_router, configure as configure_mcp
-from graph.llm import mcp_llm
+from graph.agents.summary_agent import configure as configure_summary
+from graph.agents.title_agent import configure as configure_title
+from graph.agents.tool_agent import tool_node, configure as configure_tools
+from graph.llm import context_llm, mcp_llm, title_llm, summary_llm
 from graph.state import AgentState
+from graph.tool_cache import memoize_tool
 
 
 async def build_graph(tools):
@@ -21,12 +24,20 @@ async def build_graph(tools):
     Must be called after setup_tools() so tools are available for binding.
     Stores the compiled graph on app.state.graph in main.py lifespan.
     """
+    # Build the classifier, title and summary chains once instead of per request
+    configure_context(context_llm)
+    configure_title(title_llm)
+    configure_summary(summary_llm)
+
+    # Deterministic tools answer repeat calls from the result cache
+    tools = [memoize_tool(t) for t in tools]
+
     # Bind tools to the MCP LLM and inject into the mcp_agent module
     mcp_llm_with_tools = mcp_llm.bind_tools(tools=tools)
     configure_mcp(mcp_llm_with_tools)
+    configure_tools(tools)
 
     graph = StateGraph(AgentState)
-    tool_node = ToolNode(tools=tools)
 
     # Register nodes
     graph.add_node("context_node", context_node)
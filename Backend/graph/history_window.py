@@ -0,0 +1,75 @@
+"""
+History window — picks the prior messages that fit a node's token budget.
+
+Messages are taken newest-first until the budget is spent; any single
+message longer than the per-message cap is cut down first. Tokens are
+estimated locally with a regex approximation of Llama-style BPE (words in
+~5-character pieces, digits in groups of 3, one token per symbol), which is
+close enough for budgeting and needs no tokenizer download.
+
+Metrics (per node): history.<node>.tokens_sent / history.<node>.tokens_saved
+"""
+import re
+
+from core import Settings, metrics
+
+_PIECE = re.compile(r"\d+|[^\W\d_]+|\S")
+_TRUNCATION_MARK = " …[truncated]"
+
+# Don't bother sending a sliver of an older message to fill the budget
+MIN_PARTIAL_TOKENS = 64
+
+
+def _piece_tokens(piece: str) -> int:
+    if piece.isdigit():
+        return -(-len(piece) // 3)
+    if piece.isalpha():
+        return -(-len(piece) // 5)
+    return 1
+
+
+def count_tokens(text: str) -> int:
+    """Approximate the number of LLM tokens in `text`."""
+    return sum(_piece_tokens(m.group()) for m in _PIECE.finditer(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut `text` to roughly `max_tokens`, keeping the beginning."""
+    used = 0
+    for match in _PIECE.finditer(text):
+        used += _piece_tokens(match.group())
+        if used > max_tokens:
+            return text[:match.start()].rstrip() + _TRUNCATION_MARK
+    return text
+
+
+def select_history(history: list[dict], budget: int, node: str) -> list[dict]:
+    """Return the newest messages of `history` that fit in `budget` tokens."""
+    max_message_tokens = Settings.HISTORY_MESSAGE_MAX_TOKENS
+    selected: list[dict] = []
+    total = used = 0
+    exhausted = False
+
+    for message in reversed(history):
+        tokens = count_tokens(message["content"])
+        total += tokens
+        if exhausted or used >= budget:
+            continue
+        content = message["content"]
+        if tokens > max_message_tokens:
+            content = truncate_to_tokens(content, max_message_tokens)
+            tokens = max_message_tokens
+        remaining = budget - used
+        if tokens > remaining:
+            if remaining < MIN_PARTIAL_TOKENS:
+                # Older messages are dropped too, so the window stays contiguous
+                exhausted = True
+                continue
+            content = truncate_to_tokens(content, remaining)
+            tokens = remaining
+        selected.append({**message, "content": content})
+        used += tokens
+
+    metrics.observe(f"history.{node}.tokens_sent", used)
+    metrics.observe(f"history.{node}.tokens_saved", total - used)
+    return list(reversed(selected))
@@ -46,3 +46,13 @@ title_llm = ChatGroq(
     max_tokens=12,
     temperature=0.3,
 )
+
+# ── Summarizer — compresses older turns into a running summary ──────────────
+summary_llm = ChatGroq(
+    model="llama-3.1-8b-instant",
+    api_key=Settings.GROQ_API_KEY,
+    http_client=http_client,
+    http_async_client=async_client,
+    max_tokens=400,
+    temperature=0.2,
+)
@@ -1,27 +1,102 @@
 """
-MCP client — connects to the math and joke SSE servers and caches tools.
+MCP client — loads the MCP server tools and caches them.
+
+Each server is reached in one of two modes, selected per server in Settings:
+  sse    remote FastMCP server over SSE, through a pooled set of warm
+         sessions (see mcp_pool.py)
+  local  the server module's tool functions registered in-process as
+         LangChain tools, with the same names, descriptions and schemas
 """
-from langchain_mcp_adapters.client import MultiServerMCPClient
+import importlib
+
+from langchain_core.tools import StructuredTool, ToolException
+
+from core import Settings
+from graph.mcp_pool import MCPSessionPool, BATCH_TOOL
+from graph.tool_cache import deterministic_metadata
+
+# name -> connection config + the module that defines its FastMCP instance
+MCP_SERVERS = {
+    "math": {
+        "url": Settings.MCP_MATH_URL,
+        "transport": Settings.MCP_MATH_TRANSPORT,
+        "module": "mcp_servers.math_mcp_server",
+    },
+}
 
 _tools = None
+_pools: list[MCPSessionPool] = []
+
+
+def _local_call(server, name: str):
+    async def call(**arguments):
+        # Through FastMCP's tool manager, so arguments are validated and
+        # coerced by the tool's pydantic model exactly as in SSE mode
+        try:
+            return await server._tool_manager.call_tool(name, arguments)
+        except Exception as exc:
+            raise ToolException(str(exc)) from exc
+    return call
+
+
+async def load_local_tools(module_path: str) -> list[StructuredTool]:
+    """
+    Wrap the tool functions of a FastMCP server module as LangChain tools.
+    Names, descriptions and input schemas come from the server's own
+    list_tools(), so the LLM sees exactly what the SSE mode would expose.
+    """
+    module = importlib.import_module(module_path)
+    tools = []
+    for tool in await module.mcp.list_tools():
+        if tool.name == BATCH_TOOL:
+            continue
+        tools.append(
+            StructuredTool(
+                name=tool.name,
+                description=tool.description or "",
+                args_schema=tool.inputSchema,
+                coroutine=_local_call(module.mcp, tool.name),
+                metadata=deterministic_metadata(tool.name, tool.annotations),
+            )
+        )
+    return tools
 
 
 async def setup_tools():
     """
-    Connect to MCP SSE servers (math @ 8001) and return the
-    combined tool list. Result is cached; safe to call multiple times.
+    Load tools from every configured MCP server and return the combined
+    list. Result is cached; safe to call multiple times.
     """
     global _tools
     if _tools is not None:
         return _tools
 
-    client = MultiServerMCPClient(
-        {
-            "math": {
-                "url": "http://localhost:8001/sse",
-                "transport": "sse",
-            },
-        }
-    )
-    _tools = await client.get_tools()
+    tools = []
+    for name, server in MCP_SERVERS.items():
+        if server["transport"] == "local":
+            tools.extend(await load_local_tools(server["module"]))
+            continue
+        pool = MCPSessionPool(
+            name,
+            connection={"url": server["url"], "transport": server["transport"]},
+            size=Settings.MCP_POOL_SIZE,
+            max_concurrency=Settings.MCP_MAX_CONCURRENT_CALLS,
+            health_interval=Settings.MCP_HEALTH_INTERVAL_SECONDS,
+            acquire_timeout=Settings.MCP_ACQUIRE_TIMEOUT_SECONDS,
+            batch_window=Settings.MCP_BATCH_WINDOW_MS / 1000,
+        )
+        await pool.start()
+        _pools.append(pool)
+        tools.extend(await pool.get_tools())
+
+    _tools = tools
     return _tools
+
+
+async def close_tools() -> None:
+    """Close all pooled MCP sessions (called on app shutdown)."""
+    global _tools
+    for pool in _pools:
+        await pool.close()
+    _pools.clear()
+    _tools = None
@@ -0,0 +1,290 @@
+"""
+MCP session pool — warm, long-lived client sessions per remote MCP server.
+
+Each pooled connection is owned by a background task that opens the
+session, keeps it open until it is closed or marked broken, and then
+reconnects with exponential backoff. Tool calls borrow any ready session
+(MCP multiplexes requests over one session), bounded per server by a
+semaphore. A health task pings every session periodically.
+
+Servers that expose a `batch` tool get request coalescing: tool calls
+issued within the same short window (e.g. the parallel tool calls of one
+LLM turn) are sent as a single `batch` call over one session.
+
+Metrics (per server name):
+  mcp.<name>.session_wait_ms   time a call waited for a slot + ready session
+  mcp.<name>.call_ms           tool call latency once a session was acquired
+  mcp.<name>.reconnect         sessions re-established after a failure
+  mcp.<name>.ping_failed       health pings that failed
+  mcp.<name>.batch_size        calls coalesced into one round trip
+"""
+import asyncio
+import json
+import logging
+import time
+
+from langchain_core.tools import StructuredTool, ToolException
+from langchain_mcp_adapters.sessions import create_session
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+
+from core import metrics
+from graph.tool_cache import deterministic_metadata
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_BACKOFF_INITIAL = 0.5
+RECONNECT_BACKOFF_MAX = 30.0
+
+# Server-side tool that runs several calls in one request; hidden from the LLM
+BATCH_TOOL = "batch"
+
+
+def _result_text(result) -> str:
+    return "\n".join(c.text for c in result.content if getattr(c, "type", None) == "text")
+
+
+class _Batcher:
+    """Coalesces calls submitted within `window` seconds into one batch call."""
+
+    def __init__(self, pool: "MCPSessionPool", window: float):
+        self.pool = pool
+        self.window = window
+        self._pending: list[tuple[str, dict, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Strong refs to in-flight batch sends so they are not garbage-collected
+        self._sending: set[asyncio.Task] = set()
+
+    def submit(self, tool_name: str, arguments: dict) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((tool_name, arguments, future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        self._flush_handle = None
+        task = asyncio.create_task(self._send(pending))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, pending: list[tuple[str, dict, asyncio.Future]]) -> None:
+        metrics.observe(f"mcp.{self.pool.name}.batch_size", len(pending))
+        try:
+            if len(pending) == 1:
+                tool_name, arguments, future = pending[0]
+                result = await self.pool.call_raw(tool_name, arguments)
+                outcomes = [(_result_text(result), bool(result.isError))]
+            else:
+                calls = [{"tool": name, "arguments": args} for name, args, _ in pending]
+                result = await self.pool.call_raw(BATCH_TOOL, {"calls": calls})
+                if result.isError:
+                    raise ToolException(_result_text(result))
+                outcomes = [
+                    (str(item["error"]), True) if "error" in item
+                    else (item["result"] if isinstance(item["result"], str) else json.dumps(item["result"]), False)
+                    for item in json.loads(_result_text(result))
+                ]
+        except Exception as exc:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, _, future), outcome in zip(pending, outcomes):
+            if not future.done():
+                future.set_result(outcome)
+
+
+class _PooledSession:
+    """One long-lived session, kept alive by its own owner task."""
+
+    def __init__(self, pool: "MCPSessionPool", index: int):
+        self.pool = pool
+        self.index = index
+        self.session: ClientSession | None = None
+        self._broken = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name=f"mcp-{self.pool.name}-{self.index}")
+
+    @property
+    def healthy(self) -> bool:
+        return self.session is not None and not self._broken.is_set()
+
+    def mark_broken(self) -> None:
+        self._broken.set()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        backoff = RECONNECT_BACKOFF_INITIAL
+        connected_before = False
+        while True:
+            try:
+                async with create_session(self.pool.connection) as session:
+                    await session.initialize()
+                    self._broken.clear()
+                    self.session = session
+                    if connected_before:
+                        metrics.incr(f"mcp.{self.pool.name}.reconnect")
+                        logger.info("MCP session %s/%d reconnected", self.pool.name, self.index)
+                    connected_before = True
+                    backoff = RECONNECT_BACKOFF_INITIAL
+                    self.pool.notify_ready()
+                    await self._broken.wait()
+            except asyncio.CancelledError:
+                self.session = None
+                raise
+            except Exception as exc:
+                logger.warning("MCP session %s/%d failed: %s", self.pool.name, self.index, exc)
+            self.session = None
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX)
+
+
+class MCPSessionPool:
+
+    def __init__(
+        self,
+        name: str,
+        connection: dict,
+        size: int,
+        max_concurrency: int,
+        health_interval: float,
+        acquire_timeout: float,
+        batch_window: float = 0.0,
+    ):
+        self.name = name
+        self.connection = connection
+        self.acquire_timeout = acquire_timeout
+        self.health_interval = health_interval
+        self._connections = [_PooledSession(self, i) for i in range(max(1, size))]
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._ready = asyncio.Event()
+        self._next = 0
+        self._health_task: asyncio.Task | None = None
+        self._batch_window = batch_window
+        self._batcher: _Batcher | None = None
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Open all sessions and wait until at least one is ready."""
+        for conn in self._connections:
+            conn.start()
+        self._health_task = asyncio.create_task(self._health_loop(), name=f"mcp-{self.name}-health")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise ConnectionError(f"Could not connect to MCP server '{self.name}' at {self.connection.get('url')}")
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+        for conn in self._connections:
+            await conn.close()
+
+    def notify_ready(self) -> None:
+        self._ready.set()
+
+    # ── Session checkout ──────────────────────────────────────────────────────
+
+    def _pick_ready(self) -> _PooledSession | None:
+        for offset in range(len(self._connections)):
+            conn = self._connections[(self._next + offset) % len(self._connections)]
+            if conn.healthy:
+                self._next = (conn.index + 1) % len(self._connections)
+                return conn
+        self._ready.clear()
+        return None
+
+    async def _wait_for_session(self) -> _PooledSession:
+        deadline = time.monotonic() + self.acquire_timeout
+        while (conn := self._pick_ready()) is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ToolException(f"No healthy MCP session available for '{self.name}'")
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+        return conn
+
+    # ── Calls ─────────────────────────────────────────────────────────────────
+
+    async def call_tool(self, tool_name: str, arguments: dict) -> tuple[str, bool]:
+        """Call a tool, coalescing with concurrent calls when batching is on."""
+        if self._batcher is not None:
+            return await self._batcher.submit(tool_name, arguments)
+        result = await self.call_raw(tool_name, arguments)
+        return _result_text(result), bool(result.isError)
+
+    async def call_raw(self, tool_name: str, arguments: dict):
+        start = time.perf_counter()
+        async with self._semaphore:
+            conn = await self._wait_for_session()
+            acquired = time.perf_counter()
+            metrics.observe(f"mcp.{self.name}.session_wait_ms", (acquired - start) * 1000)
+            try:
+                return await conn.session.call_tool(tool_name, arguments)
+            except McpError:
+                raise
+            except Exception:
+                # Transport-level failure: recycle this session
+                conn.mark_broken()
+                raise
+            finally:
+                metrics.observe(f"mcp.{self.name}.call_ms", (time.perf_counter() - acquired) * 1000)
+
+    async def list_tools(self):
+        async with self._semaphore:
+            conn = await self._wait_for_session()
+            return (await conn.session.list_tools()).tools
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            for conn in self._connections:
+                session = conn.session
+                if session is None:
+                    continue
+                try:
+                    await asyncio.wait_for(session.send_ping(), timeout=self.acquire_timeout)
+                except Exception as exc:
+                    metrics.incr(f"mcp.{self.name}.ping_failed")
+                    logger.warning("MCP ping %s/%d failed: %s", self.name, conn.index, exc)
+                    conn.mark_broken()
+
+    # ── LangChain tools ───────────────────────────────────────────────────────
+
+    async def get_tools(self) -> list[StructuredTool]:
+        """Expose the server's tools as LangChain tools that call through the pool."""
+        tools = await self.list_tools()
+        if self._batch_window > 0 and any(t.name == BATCH_TOOL for t in tools):
+            self._batcher = _Batcher(self, self._batch_window)
+        return [self._make_tool(tool) for tool in tools if tool.name != BATCH_TOOL]
+
+    def _make_tool(self, tool) -> StructuredTool:
+        async def call(**arguments):
+            text, is_error = await self.call_tool(tool.name, arguments)
+            if is_error:
+                raise ToolException(text or f"Tool '{tool.name}' failed")
+            return text
+
+        return StructuredTool(
+            name=tool.name,
+            description=tool.description or "",
+            args_schema=tool.inputSchema,
+            coroutine=call,
+            metadata=deterministic_metadata(tool.name, tool.annotations),
+        )
@@ -33,3 +33,13 @@ TITLE_AGENT_PROMPT = (
     "produce a short title of at most 6 words that captures the topic. "
     "Return ONLY the title — no quotes, no punctuation at the end."
 )
+
+SUMMARY_AGENT_PROMPT = (
+    "You maintain a running summary of a conversation between a user and Nova, an AI assistant. "
+    "Given the previous summary and the newer messages, write an updated summary of the whole conversation. "
+    "Keep facts, numbers, results, user preferences and open questions; drop pleasantries. "
+    "Stay under 200 words. Return ONLY the summary text."
+)
+
+# Injected after the agent prompt when a session has a rolling summary
+SUMMARY_CONTEXT_PROMPT = "Summary of the earlier conversation:\n{summary}"
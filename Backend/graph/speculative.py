@@ -0,0 +1,101 @@
+"""
+Speculative execution — start the chat answer while the classifier decides.
+
+speculative_events() yields events shaped like graph.astream_events(v2) so
+api/ask.py can consume either source unchanged. When neither the
+pre-router nor the routing cache can decide and the query needs the LLM
+classifier, the chat LLM is streamed concurrently into a buffer:
+
+  router picks chat → buffered tokens are released, then the rest streams
+  router picks mcp  → the speculative run is cancelled, the graph runs
+                      with the route pre-set (context_node is skipped)
+
+Metrics: speculation.win / speculation.loss / speculation.skipped and
+speculation.wasted_tokens (chunks produced by cancelled runs).
+"""
+import asyncio
+import logging
+from typing import AsyncIterator
+
+from core import metrics
+from graph.agents.chat_agent import build_chat_messages
+from graph.agents.context_agent import classify_with_llm, route_locally
+from graph.llm import chat_llm
+from graph.state import AgentState
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class _SpeculativeChat:
+    """Streams the chat LLM into a queue until released or cancelled."""
+
+    def __init__(self, state: AgentState):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.produced = 0
+        self._task = asyncio.create_task(self._run(state))
+
+    async def _run(self, state: AgentState) -> None:
+        try:
+            async for chunk in chat_llm.astream(build_chat_messages(state)):
+                self.produced += 1
+                self.queue.put_nowait(chunk)
+        except Exception as exc:
+            self.queue.put_nowait(exc)
+        self.queue.put_nowait(_DONE)
+
+    async def chunks(self) -> AsyncIterator:
+        while True:
+            item = await self.queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def cancel(self) -> None:
+        if not self._task.done():
+            self._task.cancel()
+
+
+def _chat_stream_event(chunk) -> dict:
+    return {
+        "event": "on_chat_model_stream",
+        "name": "speculative_chat",
+        "metadata": {"langgraph_node": "chat_node"},
+        "data": {"chunk": chunk},
+    }
+
+
+async def speculative_events(graph, state: AgentState) -> AsyncIterator[dict]:
+    """Run `state` through the graph, speculating on the chat branch."""
+    intent = route_locally(state.query, state.history)
+    if intent is not None:
+        # Decided by rules or cache — nothing to overlap with
+        metrics.incr("speculation.skipped")
+        routed = state.model_copy(update={"node": intent})
+        async for event in graph.astream_events(input=routed, version="v2"):
+            yield event
+        return
+
+    speculative = _SpeculativeChat(state)
+    try:
+        intent = await classify_with_llm(state.query, state.history)
+
+        if intent == "chat":
+            metrics.incr("speculation.win")
+            async for chunk in speculative.chunks():
+                yield _chat_stream_event(chunk)
+            return
+
+        speculative.cancel()
+        metrics.incr("speculation.loss")
+        metrics.incr("speculation.wasted_tokens", speculative.produced)
+        logger.debug("Speculative chat discarded after %d chunks", speculative.produced)
+
+        routed = state.model_copy(update={"node": intent})
+        async for event in graph.astream_events(input=routed, version="v2"):
+            yield event
+    finally:
+        speculative.cancel()
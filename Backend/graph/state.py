@@ -1,6 +1,7 @@
 """
 AgentState — shared state object threaded through LangGraph nodes.
 """
+import operator
 from typing import Annotated, Sequence
 
 from langchain_core.messages import BaseMessage
@@ -12,6 +13,10 @@ class AgentState(BaseModel):
     query: str
     # Prior messages fed as context: [{"role": "human"|"assistant", "content": str}]
     history: list[dict] = []
+    # Rolling summary of turns older than `history`, if any
+    summary: str | None = None
     answer: str | None = None
     node: str | None = None
     messages: Annotated[Sequence[BaseMessage], add_messages] = []
+    # One entry per tool_node pass: {"tools": [...], "wall_ms": float, "serial_ms": float}
+    tool_runs: Annotated[list[dict], operator.add] = []
@@ -0,0 +1,81 @@
+"""
+Tool result cache — memoizes calls to deterministic tools.
+
+MCP has no "same input, same output" annotation (readOnlyHint and
+idempotentHint don't promise it), so the cacheable tools are listed here in
+CACHEABLE_TOOLS and must also carry both standard hints; mcp_client/mcp_pool
+record the outcome on the LangChain tool's metadata. Results are keyed on
+tool name + canonicalized arguments and held in a bounded LRU
+(cache.tool_results.* metrics). Errors are never cached, and every other
+tool (e.g. get_random_joke) is passed through untouched.
+"""
+import json
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+from core import Settings, TTLCache
+
+# Pure functions of their arguments (mcp_servers/math_mcp_server.py)
+CACHEABLE_TOOLS = frozenset({
+    "add", "subtract", "multiply", "divide", "power", "modulus", "sqrt",
+    "calculate_area_circle", "calculate_area_rectangle", "calculate_area_triangle",
+})
+
+_results = TTLCache(
+    "tool_results",
+    maxsize=Settings.TOOL_CACHE_SIZE,
+    ttl=Settings.TOOL_CACHE_TTL_SECONDS or None,
+)
+
+
+def is_deterministic(tool: BaseTool) -> bool:
+    return bool((tool.metadata or {}).get("deterministic"))
+
+
+def deterministic_metadata(name: str, annotations) -> dict:
+    """LangChain tool metadata for MCP tool `name` with its annotations."""
+    deterministic = (
+        name in CACHEABLE_TOOLS
+        and bool(getattr(annotations, "readOnlyHint", False))
+        and bool(getattr(annotations, "idempotentHint", False))
+    )
+    return {"deterministic": deterministic}
+
+
+def _canonical(value):
+    # 2 and 2.0 are the same argument to a float-typed tool
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def cache_key(tool_name: str, arguments: dict) -> tuple[str, str]:
+    return tool_name, json.dumps(_canonical(arguments), sort_keys=True, separators=(",", ":"))
+
+
+def memoize_tool(tool: BaseTool) -> BaseTool:
+    """Return `tool` wrapped with the result cache if it is deterministic."""
+    if not is_deterministic(tool):
+        return tool
+
+    async def call(**arguments):
+        key = cache_key(tool.name, arguments)
+        result = _results.get(key)
+        if result is None:
+            result = await tool.ainvoke(arguments)
+            _results.set(key, result)
+        return result
+
+    return StructuredTool(
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.args_schema,
+        coroutine=call,
+        metadata=tool.metadata,
+    )
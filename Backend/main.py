@@ -1,12 +1,16 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
-from api import test_route, auth_route, ask_route
+from api import test_route, auth_route, ask_route, metrics_route
 from core import engine, Base, setup_logging
-from graph import setup_tools, build_graph
+from graph import setup_tools, close_tools, build_graph
+from services.jobs import job_queue
+from services.stream_runs import stream_runs
+from services.token_gc import run_token_gc
 
 setup_logging()
 
@@ -21,8 +25,18 @@ async def lifespan(app: FastAPI):
     graph = await build_graph(tools)
     app.state.graph = graph
 
+    # 3. Background work: post-turn jobs and refresh-token pruning
+    job_queue.start()
+    token_gc = asyncio.create_task(run_token_gc(), name="token-gc")
+
     yield
 
+    # 4. Stop background work and close pooled MCP sessions
+    token_gc.cancel()
+    await stream_runs.close()
+    await job_queue.stop()
+    await close_tools()
+
 
 fast_app = FastAPI(
     lifespan=lifespan
@@ -31,6 +45,7 @@ fast_app = FastAPI(
 fast_app.include_router(test_route)
 fast_app.include_router(auth_route)
 fast_app.include_router(ask_route)
+fast_app.include_router(metrics_route)
 fast_app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://127.0.0.1:5173","http://localhost:5173"], 
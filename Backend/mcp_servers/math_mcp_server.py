@@ -1,33 +1,42 @@
 """
 Math MCP Server — runs as a standalone FastMCP SSE server on port 8001.
 Start with: python mcp_servers/math_mcp_server.py
+
+Every tool here is a pure function, annotated read-only and idempotent; the
+API caches their results (allowlisted in graph/tool_cache.py).
 """
+import json
 import math as _math
 
 from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
 
 mcp = FastMCP("MathServer",port=8001)
 
+# No side effects and safe to repeat; client-side caching also needs the
+# tool in tool_cache.CACHEABLE_TOOLS
+DETERMINISTIC = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def add(a: float, b: float) -> float:
     """Return the sum of two numbers."""
     return a + b
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def subtract(a: float, b: float) -> float:
     """Return the difference of two numbers (a - b)."""
     return a - b
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def multiply(a: float, b: float) -> float:
     """Return the product of two numbers."""
     return a * b
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def divide(a: float, b: float) -> float:
     """Return the division of two numbers (a / b). Raises error on divide-by-zero."""
     if b == 0:
@@ -35,13 +44,13 @@ def divide(a: float, b: float) -> float:
     return a / b
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def power(base: float, exponent: float) -> float:
     """Return base raised to the power of exponent."""
     return base ** exponent
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def modulus(a: float, b: float) -> float:
     """Return the remainder of a divided by b."""
     if b == 0:
@@ -49,7 +58,7 @@ def modulus(a: float, b: float) -> float:
     return a % b
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def sqrt(n: float) -> float:
     """Return the square root of a non-negative number."""
     if n < 0:
@@ -57,23 +66,55 @@ def sqrt(n: float) -> float:
     return _math.sqrt(n)
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def calculate_area_circle(radius: float) -> float:
     """Calculate the area of a circle given its radius."""
     return _math.pi * (radius ** 2)
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def calculate_area_rectangle(length: float, width: float) -> float:
     """Calculate the area of a rectangle given its length and width."""
     return length * width
 
 
-@mcp.tool()
+@mcp.tool(annotations=DETERMINISTIC)
 def calculate_area_triangle(base: float, height: float) -> float:
     """Calculate the area of a triangle given its base and height."""
     return 0.5 * base * height
 
 
+_BATCHABLE = {
+    fn.__name__
+    for fn in (
+        add, subtract, multiply, divide, power, modulus, sqrt,
+        calculate_area_circle, calculate_area_rectangle, calculate_area_triangle,
+    )
+}
+
+
+@mcp.tool(annotations=DETERMINISTIC)
+async def batch(calls: list[dict]) -> str:
+    """
+    Run several math tool calls in one request (used by the API client, not the LLM).
+    Each call is {"tool": name, "arguments": {...}}. Returns a JSON list with one
+    {"result": value} or {"error": message} per call, in order.
+    """
+    results = []
+    for call in calls:
+        name = call.get("tool")
+        if name not in _BATCHABLE:
+            results.append({"error": f"Unknown tool '{name}'"})
+            continue
+        try:
+            # Through the tool manager, so arguments are validated and coerced
+            # exactly as for an unbatched call ("2" -> 2.0)
+            result = await mcp._tool_manager.call_tool(name, call.get("arguments", {}))
+            results.append({"result": result})
+        except Exception as exc:
+            results.append({"error": str(exc)})
+    return json.dumps(results)
+
+
 if __name__ == "__main__":
     mcp.run(transport="sse")
@@ -6,7 +6,7 @@ import enum
 from datetime import datetime, timezone
 
 import uuid6
-from sqlalchemy import String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core import Base
@@ -19,6 +19,11 @@ class MessageRole(enum.Enum):
 
 class ConversationMessage(Base):
     __tablename__ = "conversation_messages"
+    # Serves recent-history reads and keyset pagination as range scans;
+    # also covers the session_id foreign key
+    __table_args__ = (
+        Index("ix_conversation_messages_session_created", "session_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
@@ -28,8 +33,7 @@ class ConversationMessage(Base):
     session_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("conversation_sessions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     role: Mapped[MessageRole] = mapped_column(
         Enum(MessageRole),
@@ -5,7 +5,7 @@ Each user can have many sessions (e.g. "Math Help", "Python Jokes").
 from datetime import datetime, timezone
 
 import uuid6
-from sqlalchemy import String, Text, DateTime, ForeignKey
+from sqlalchemy import String, Text, DateTime, ForeignKey, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core import Base
@@ -13,6 +13,11 @@ from core import Base
 
 class ConversationSession(Base):
     __tablename__ = "conversation_sessions"
+    # Sidebar listing (newest activity first) as one index range scan;
+    # also covers the user_id foreign key
+    __table_args__ = (
+        Index("ix_conversation_sessions_user_last_message", "user_id", "last_message_at"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
@@ -22,8 +27,7 @@ class ConversationSession(Base):
     user_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     # LLM-generated short title for the conversation
     name: Mapped[str | None] = mapped_column(
@@ -31,11 +35,39 @@ class ConversationSession(Base):
         nullable=True,
         default=None
     )
+    # Rolling summary of older turns, covering messages up to summary_until
+    summary: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        default=None
+    )
+    # id of the newest message folded into `summary` (UUIDv7, time-ordered)
+    summary_until: Mapped[str | None] = mapped_column(
+        String(36),
+        nullable=True,
+        default=None
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         default=lambda: datetime.now(timezone.utc)
     )
+    # Denormalized activity summary, maintained by AskService.save_turn
+    last_message_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc)
+    )
+    message_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+    last_message_preview: Mapped[str | None] = mapped_column(
+        String(160),
+        nullable=True,
+        default=None
+    )
 
     user: Mapped["Users"] = relationship(   # noqa: F821
         "Users",
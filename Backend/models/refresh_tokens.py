@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 
 import uuid6
-from sqlalchemy import String, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import String, DateTime, Boolean, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core import Base
@@ -20,20 +20,35 @@ class RefreshTokens(Base):
         nullable=False,
         index=True
     )
+    # SHA-256 hex digest of the raw refresh token
     token: Mapped[str] = mapped_column(
-        Text,
-        nullable=False
+        String(64),
+        nullable=False,
+        unique=True
     )
     revoked: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
         default=False
     )
+    # When the token was rotated or revoked; the collector keeps revoked rows
+    # for TOKEN_GC_REVOKED_RETENTION_MINUTES after this for reuse detection
+    revoked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        index=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         default=lambda: datetime.now(timezone.utc)
     )
+    # Same instant as the JWT's exp claim; rows past it are pruned
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True
+    )
     user: Mapped["Users"] = relationship(
         "Users",
         back_populates="refresh_tokens",
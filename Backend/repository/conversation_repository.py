@@ -1,5 +1,9 @@
-from sqlalchemy import select
+from datetime import datetime, timezone
+
+import uuid6
+from sqlalchemy import select, update, insert, inspect, or_, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from models import ConversationSession, ConversationMessage, MessageRole
 
@@ -22,11 +26,48 @@ class ConversationRepository:
         )
         return result.scalar_one_or_none()
 
-    async def create_session(self, user_id: str) -> ConversationSession:
-        session = ConversationSession(user_id=user_id)
-        self.db.add(session)
-        await self.db.flush()   # populate session.id without committing
-        return session
+    async def get_session_with_history(
+        self, session_id: str, user_id: str, limit: int
+    ) -> tuple[ConversationSession | None, list[dict]]:
+        """
+        Ownership check and recent history in one query: the session (if
+        owned by the user) outer-joined to its newest `limit` messages.
+        Returns (session or None, messages oldest first as plain dicts).
+        """
+        recent = (
+            select(
+                ConversationMessage.id,
+                ConversationMessage.role,
+                ConversationMessage.content,
+                ConversationMessage.created_at,
+            )
+            .where(ConversationMessage.session_id == session_id)
+            .order_by(ConversationMessage.created_at.desc(), ConversationMessage.id.desc())
+            .limit(limit)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(ConversationSession, recent.c.id, recent.c.role, recent.c.content)
+            .outerjoin(recent, true())
+            .where(
+                ConversationSession.id == session_id,
+                ConversationSession.user_id == user_id,
+            )
+            .order_by(recent.c.created_at, recent.c.id)
+        )
+        rows = result.all()
+        if not rows:
+            return None, []
+        history = [
+            {"id": row.id, "role": row.role.value, "content": row.content}
+            for row in rows
+            if row.id is not None
+        ]
+        return rows[0][0], history
+
+    def new_session(self, user_id: str) -> ConversationSession:
+        """Build a session in memory, id assigned; record_turn() inserts it."""
+        return ConversationSession(id=str(uuid6.uuid7()), user_id=user_id, message_count=0)
 
     async def set_session_name(
         self, session: ConversationSession, name: str
@@ -34,15 +75,74 @@ class ConversationRepository:
         session.name = name
         self.db.add(session)
 
+    async def set_session_summary(
+        self, session: ConversationSession, summary: str, summary_until: str
+    ) -> None:
+        session.summary = summary
+        session.summary_until = summary_until
+        self.db.add(session)
+
     async def list_sessions_for_user(
-        self, user_id: str
-    ) -> list[ConversationSession]:
+        self, user_id: str, limit: int, before: str | None = None
+    ) -> tuple[list[ConversationSession], bool]:
+        """
+        Keyset page of a user's sessions, most recent activity first, plus
+        whether older ones exist. `before` is the id of the last session of
+        the previous page; its last_message_at is resolved by primary key.
+        """
+        last_at = ConversationSession.last_message_at
+        stmt = select(ConversationSession).where(ConversationSession.user_id == user_id)
+        if before is not None:
+            cursor_time = (
+                select(ConversationSession.last_message_at)
+                .where(ConversationSession.id == before)
+                .scalar_subquery()
+            )
+            stmt = stmt.where(
+                last_at <= cursor_time,
+                or_(last_at < cursor_time, ConversationSession.id < before),
+            )
         result = await self.db.execute(
-            select(ConversationSession)
-            .where(ConversationSession.user_id == user_id)
-            .order_by(ConversationSession.created_at.desc())
+            stmt.order_by(last_at.desc(), ConversationSession.id.desc()).limit(limit + 1)
         )
-        return list(result.scalars().all())
+        rows = list(result.scalars().all())
+        return rows[:limit], len(rows) > limit
+
+    async def record_turn(
+        self,
+        session: ConversationSession,
+        messages: list[dict],
+        preview: str,
+        name: str | None = None,
+    ) -> None:
+        """
+        Write one turn in two statements: insert a new session or bump an
+        existing one's activity columns (and name), then insert all
+        `messages` with a single multi-row INSERT. Does not commit.
+        """
+        activity = {
+            "last_message_at": datetime.now(timezone.utc),
+            "last_message_preview": preview,
+        }
+        if name is not None:
+            activity["name"] = name
+        if inspect(session).transient:
+            for key, value in activity.items():
+                setattr(session, key, value)
+            session.message_count = len(messages)
+            self.db.add(session)
+            await self.db.flush()
+        else:
+            await self.db.execute(
+                update(ConversationSession)
+                .where(ConversationSession.id == session.id)
+                .values(message_count=ConversationSession.message_count + len(messages), **activity)
+            )
+            # Keep the caller's copy current without marking it dirty
+            for key, value in activity.items():
+                set_committed_value(session, key, value)
+            set_committed_value(session, "message_count", session.message_count + len(messages))
+        await self.db.execute(insert(ConversationMessage).values(messages))
 
     async def delete_session(self, session: ConversationSession) -> None:
         await self.db.delete(session)
@@ -62,22 +162,72 @@ class ConversationRepository:
         rows = result.scalars().all()
         return list(reversed(rows))
 
-    async def get_all_messages(
-        self, session_id: str
+    async def get_messages_page(
+        self,
+        session_id: str,
+        limit: int,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> tuple[list[ConversationMessage], bool]:
+        """
+        Keyset page of messages, oldest first, plus whether more exist in the
+        direction of travel. Without a cursor (or with `before`) the page is
+        the newest `limit` messages older than the cursor; with `after` it is
+        the oldest `limit` messages newer than it. The cursor's created_at is
+        resolved by primary key so the scan stays on (session_id, created_at).
+        """
+        created_at = ConversationMessage.created_at
+        stmt = select(ConversationMessage).where(ConversationMessage.session_id == session_id)
+        cursor = before or after
+        if cursor is not None:
+            cursor_time = (
+                select(ConversationMessage.created_at)
+                .where(ConversationMessage.id == cursor)
+                .scalar_subquery()
+            )
+            if before is not None:
+                stmt = stmt.where(
+                    created_at <= cursor_time,
+                    or_(created_at < cursor_time, ConversationMessage.id < cursor),
+                )
+            else:
+                stmt = stmt.where(
+                    created_at >= cursor_time,
+                    or_(created_at > cursor_time, ConversationMessage.id > cursor),
+                )
+
+        if after is not None:
+            stmt = stmt.order_by(created_at, ConversationMessage.id)
+        else:
+            stmt = stmt.order_by(created_at.desc(), ConversationMessage.id.desc())
+        result = await self.db.execute(stmt.limit(limit + 1))
+        rows = list(result.scalars().all())
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if after is None:
+            rows.reverse()
+        return rows, has_more
+
+    async def get_messages_after(
+        self, session_id: str, after_id: str | None
     ) -> list[ConversationMessage]:
-        result = await self.db.execute(
-            select(ConversationMessage)
-            .where(ConversationMessage.session_id == session_id)
-            .order_by(ConversationMessage.created_at)
-        )
+        """Return messages newer than `after_id` (all if None), oldest first."""
+        stmt = select(ConversationMessage).where(ConversationMessage.session_id == session_id)
+        if after_id is not None:
+            stmt = stmt.where(ConversationMessage.id > after_id)
+        result = await self.db.execute(stmt.order_by(ConversationMessage.id))
         return list(result.scalars().all())
 
-    async def add_message(
+    def build_message(
         self, session_id: str, role: MessageRole, content: str, source: str | None = None
-    ) -> None:
-        self.db.add(ConversationMessage(
-            session_id=session_id,
-            role=role,
-            content=content,
-            source=source,
-        ))
+    ) -> dict:
+        """Row values for a new message, id and timestamp assigned up front."""
+        return {
+            "id": str(uuid6.uuid7()),
+            "session_id": session_id,
+            "role": role,
+            "content": content,
+            "source": source,
+            "created_at": datetime.now(timezone.utc),
+        }
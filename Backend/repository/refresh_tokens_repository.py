@@ -1,8 +1,10 @@
 import hashlib
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, select, update, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core import Settings
 from models import RefreshTokens
 
 
@@ -13,9 +15,12 @@ class RefreshTokensRepository:
 
     async def register_token(self, user_id: str, token: str):
         hashed_token = hashlib.sha256(token.encode()).hexdigest()
+        # Mirrors the JWT exp claim set by create_refresh_token()
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=float(Settings.REFRESH_TOKEN_EXPIRE_MINUTES))
         refresh_token = RefreshTokens(
             user_id=user_id,
-            token=hashed_token
+            token=hashed_token,
+            expires_at=expires_at
         )
         self.db.add(refresh_token)
         await self.db.flush()
@@ -33,7 +38,7 @@ class RefreshTokensRepository:
         await self.db.execute(
             update(RefreshTokens)
             .where(RefreshTokens.token_id == token_id)
-            .values(revoked=True)
+            .values(revoked=True, revoked_at=datetime.now(timezone.utc))
         )
         await self.db.flush()
 
@@ -41,3 +46,22 @@ class RefreshTokensRepository:
         await self.db.execute(delete(RefreshTokens).where(RefreshTokens.user_id == user_id))
         await self.db.flush()
 
+    async def delete_prunable(
+        self, now: datetime, revoked_before: datetime, batch_size: int
+    ) -> int:
+        """
+        Delete up to `batch_size` expired tokens, or tokens revoked before
+        `revoked_before`. Returns the number of rows deleted.
+        """
+        result = await self.db.execute(
+            select(RefreshTokens.token_id)
+            .where(or_(
+                RefreshTokens.expires_at < now,
+                and_(RefreshTokens.revoked.is_(True), RefreshTokens.revoked_at < revoked_before),
+            ))
+            .limit(batch_size)
+        )
+        token_ids = list(result.scalars().all())
+        if token_ids:
+            await self.db.execute(delete(RefreshTokens).where(RefreshTokens.token_id.in_(token_ids)))
+        return len(token_ids)
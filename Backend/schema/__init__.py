@@ -1,2 +1,2 @@
 from .users import CreateUser, ReadUser
-from .ask import AskRequest, AskResponse, MessageOut, SessionOut, RenameSessionRequest
+from .ask import AskRequest, AskResponse, MessageOut, MessagePage, SessionOut, SessionPage, RenameSessionRequest
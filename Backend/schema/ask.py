@@ -20,10 +20,23 @@ class MessageOut(BaseModel):
     created_at: str
 
 
+class MessagePage(BaseModel):
+    messages: list[MessageOut]   # oldest first
+    next_cursor: str | None      # pass as before/after (same as this request) for the next page
+
+
 class SessionOut(BaseModel):
     id: str
     name: str | None
     created_at: str
+    last_message_at: str | None = None
+    message_count: int = 0
+    preview: str | None = None
+
+
+class SessionPage(BaseModel):
+    sessions: list[SessionOut]   # most recent activity first
+    next_cursor: str | None      # pass as `before` for the next (older) page
 
 
 class RenameSessionRequest(BaseModel):
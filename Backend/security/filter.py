@@ -1,16 +1,25 @@
 from fastapi import Depends, HTTPException, status, Request
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from core import get_async_session
+from core.database import async_session_maker
 from models import Users, Roles
 from security import verify_access_token
+from security.principal import Principal, principal_cache
 
 
-async def get_current_user(
-        request: Request,
-        session: AsyncSession = Depends(get_async_session)
-):
+async def _load_principal(user_id: str) -> Principal | None:
+    """Column-only lookup — never loads the Users relationships."""
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(Users.id, Users.email, Users.role).where(Users.id == user_id)
+        )
+        row = result.one_or_none()
+    if row is None:
+        return None
+    return Principal(id=row.id, email=row.email, role=Roles(row.role))
+
+
+async def get_current_user(request: Request) -> Principal:
     token: str | None = request.cookies.get("access_token")
     if token is None:
         raise HTTPException(
@@ -27,19 +36,21 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    result = await session.execute(select(Users).where(Users.id == user_id))
-    user = result.scalar_one_or_none()
+    user = principal_cache.get(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        user = await _load_principal(user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        principal_cache.set(user_id, user)
     return user
 
 
 def require_roles(*allowed_roles: Roles):
-    async def role_checker(current_user: Users = Depends(get_current_user)) -> Users:
+    async def role_checker(current_user: Principal = Depends(get_current_user)) -> Principal:
         user_role = Roles(current_user.role)
         if user_role not in allowed_roles:
             raise HTTPException(
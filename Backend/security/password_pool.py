@@ -0,0 +1,60 @@
+"""
+Password pool — runs Argon2 hashing and verification off the event loop.
+
+Argon2 is deliberately expensive (tens of milliseconds of CPU and tens of
+MB of memory per call). Run inline, a login burst stalls every request on
+the worker, including in-flight chat streams. Calls are instead handed to a
+dedicated thread pool; argon2-cffi releases the GIL while hashing, so the
+loop keeps serving other requests.
+
+Admission is bounded: at most PASSWORD_HASH_WORKERS calls run and at most
+PASSWORD_HASH_QUEUE_LIMIT wait. Anything beyond that is rejected with 503
+and Retry-After instead of queueing without bound.
+
+Metrics:
+  auth.password.wait_ms    time a call queued before a worker picked it up
+  auth.password.run_ms     time spent inside Argon2
+  auth.password.rejected   calls refused because the queue was full
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+from core import Settings, metrics
+
+_executor = ThreadPoolExecutor(
+    max_workers=Settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="argon2",
+)
+# Calls admitted (running + queued); only touched from the event loop thread
+_in_flight = 0
+
+
+async def run_in_password_pool(fn, *args):
+    """Run `fn(*args)` on the password pool, or raise 503 when saturated."""
+    global _in_flight
+    if _in_flight >= Settings.PASSWORD_HASH_WORKERS + Settings.PASSWORD_HASH_QUEUE_LIMIT:
+        metrics.incr("auth.password.rejected")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    submitted = time.perf_counter()
+
+    def timed():
+        started = time.perf_counter()
+        result = fn(*args)
+        return started, time.perf_counter(), result
+
+    _in_flight += 1
+    try:
+        started, finished, result = await asyncio.get_running_loop().run_in_executor(_executor, timed)
+    finally:
+        _in_flight -= 1
+    metrics.observe("auth.password.wait_ms", (started - submitted) * 1000)
+    metrics.observe("auth.password.run_ms", (finished - started) * 1000)
+    return result
@@ -0,0 +1,32 @@
+"""
+Principal — the authenticated user as seen by protected endpoints.
+
+get_current_user resolves a verified access token to a Principal (id,
+email, role) loaded with a column-only query — never the ORM Users row, so
+its selectin-loaded refresh_tokens collection is not touched. Principals
+are cached per worker for PRINCIPAL_CACHE_TTL_SECONDS and dropped on
+logout and on refresh-token reuse detection.
+"""
+from dataclasses import dataclass
+
+from core import Settings, TTLCache
+from models import Roles
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: str
+    email: str
+    role: Roles
+
+
+principal_cache = TTLCache(
+    "principals",
+    maxsize=Settings.PRINCIPAL_CACHE_SIZE,
+    ttl=Settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(user_id: str) -> None:
+    """Forget a cached principal so the next request re-reads the user."""
+    principal_cache.pop(user_id)
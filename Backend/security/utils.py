@@ -1,20 +1,53 @@
+import hashlib
+import time
 from datetime import datetime, timezone, timedelta
 
 from fastapi import HTTPException, status
 from jose import jwt, JWTError, ExpiredSignatureError
 from passlib.context import CryptContext
 
-from core import Settings
+from core import Settings, TTLCache
+from security.password_pool import run_in_password_pool
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# min/max rounds pin time_cost so needs_update() flags hashes made with a
+# different value; memory_cost is compared by passlib itself
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__rounds=Settings.ARGON2_TIME_COST,
+    argon2__min_rounds=Settings.ARGON2_TIME_COST,
+    argon2__max_rounds=Settings.ARGON2_TIME_COST,
+    argon2__memory_cost=Settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=Settings.ARGON2_PARALLELISM,
+)
 
 
-def hash_password(plain_text: str) -> str:
-    return pwd_context.hash(plain_text)
+def _needs_rehash(hashed_pwd: str) -> bool:
+    if pwd_context.needs_update(hashed_pwd):
+        return True
+    # passlib does not compare parallelism
+    return pwd_context.handler().from_string(hashed_pwd).parallelism != Settings.ARGON2_PARALLELISM
 
 
-def verify_password(plain_text: str, hashed_pwd: str) -> bool:
-    return pwd_context.verify(plain_text, hashed_pwd)
+def _verify_and_update(plain_text: str, hashed_pwd: str) -> tuple[bool, str | None]:
+    if not pwd_context.verify(plain_text, hashed_pwd):
+        return False, None
+    if _needs_rehash(hashed_pwd):
+        return True, pwd_context.hash(plain_text)
+    return True, None
+
+
+async def hash_password(plain_text: str) -> str:
+    return await run_in_password_pool(pwd_context.hash, plain_text)
+
+
+async def verify_password(plain_text: str, hashed_pwd: str) -> tuple[bool, str | None]:
+    """
+    Check a password against its stored hash. Returns (valid, new_hash);
+    new_hash is set when the stored hash uses outdated Argon2 parameters
+    and should replace it.
+    """
+    return await run_in_password_pool(_verify_and_update, plain_text, hashed_pwd)
 
 
 def create_access_token(data: dict) -> str:
@@ -25,10 +58,19 @@ def create_access_token(data: dict) -> str:
     return jwt.encode(claims=to_encode, key=Settings.ACCESS_SECRET_KEY, algorithm=Settings.ALGORITHM)
 
 
+# sha256(token) -> verified claims, each held until the token's own exp.
+# The same cookie is presented on every request of a session, so most
+# requests skip the JWT decode and signature check entirely.
+_access_claims_cache = TTLCache("access_tokens", maxsize=Settings.ACCESS_TOKEN_CACHE_SIZE)
+
+
 def verify_access_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _access_claims_cache.get(key)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, Settings.ACCESS_SECRET_KEY, algorithms=[Settings.ALGORITHM])
-        return payload
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -41,6 +83,10 @@ def verify_access_token(token: str) -> dict:
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    remaining = payload["exp"] - time.time() if "exp" in payload else None
+    if remaining is not None and remaining > 0:
+        _access_claims_cache.set(key, payload, ttl=remaining)
+    return payload
 
 
 def create_refresh_token(data: dict) -> str:
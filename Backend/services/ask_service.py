@@ -1,14 +1,104 @@
+import asyncio
 import logging
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from graph import generate_conversation_title
+from core import Settings, metrics
+from core.database import async_session_maker, count_round_trips
+from graph import generate_conversation_title, local_conversation_title, summarize_conversation
 from models import ConversationSession, ConversationMessage, MessageRole
 from repository.conversation_repository import ConversationRepository
+from services.history_cache import history_cache
+from services.jobs import job_queue
 
 logger = logging.getLogger(__name__)
 
+# Length of the last-message preview stored on the session for the sidebar
+PREVIEW_CHARS = 160
+
+
+async def _refresh_summary(session_id: str) -> None:
+    """
+    Job: fold all but the newest SUMMARY_KEEP_RECENT unsummarized messages
+    into the summary. Raises on failure so the job queue retries it.
+    """
+    async with async_session_maker() as db:
+        repo = ConversationRepository(db)
+        session = await db.get(ConversationSession, session_id)
+        if session is None:
+            return
+        messages = await repo.get_messages_after(session_id, session.summary_until)
+        to_fold = messages[:-Settings.SUMMARY_KEEP_RECENT] if Settings.SUMMARY_KEEP_RECENT else messages
+        if not to_fold:
+            return
+        summary = await summarize_conversation(
+            session.summary,
+            [{"role": m.role.value, "content": m.content} for m in to_fold],
+        )
+        await repo.set_session_summary(session, summary, to_fold[-1].id)
+        await db.commit()
+        metrics.incr("summary.refreshed")
+        metrics.observe("summary.messages_folded", len(to_fold))
+
+
+async def _set_title(session_id: str, query: str, answer: str, placeholder: str | None) -> str | None:
+    """
+    Job: generate an LLM title and persist it if the session still carries
+    `placeholder` (None = unnamed). Returns the title, or None if the
+    session was deleted or renamed meanwhile.
+    """
+    title = await generate_conversation_title(query, answer)
+    async with async_session_maker() as db:
+        session = await db.get(ConversationSession, session_id)
+        if session is None or session.name != placeholder:
+            return None
+        await ConversationRepository(db).set_session_name(session, title)
+        await db.commit()
+    return title
+
+
+def schedule_title(
+    session_id: str, query: str, answer: str, placeholder: str | None = None
+) -> asyncio.Future | None:
+    """
+    Queue LLM title generation for a session's first turn, unless
+    TITLE_STRATEGY is "local" or a hybrid placeholder is not sampled for
+    refinement. Returns a future resolving to the title (None on failure),
+    or None when nothing was queued.
+    """
+    if Settings.TITLE_STRATEGY == "local":
+        return None
+    if Settings.TITLE_STRATEGY == "hybrid" and random.random() >= Settings.TITLE_LLM_SAMPLE_RATE:
+        metrics.incr("title.llm_skipped")
+        return None
+    return job_queue.submit("title", session_id, _set_title, session_id, query, answer, placeholder)
+
+
+async def _save_partial_turn(session: ConversationSession, query: str, partial: str) -> None:
+    """Job: persist the answer a cancelled stream had produced so far."""
+    async with ask_service_scope() as service:
+        await service.complete_turn(session, query, partial, source="partial")
+
+
+def schedule_partial_turn(session: ConversationSession, query: str, partial: str) -> None:
+    """Queue persistence of a cancelled stream's partial answer."""
+    job_queue.submit("partial_turn", session.id, _save_partial_turn, session, query, partial)
+
+
+@asynccontextmanager
+async def ask_service_scope() -> AsyncIterator["AskService"]:
+    """
+    AskService on a short-lived DB session. The connection goes back to the
+    pool when the block exits, so callers open one scope to read and one to
+    write around LLM work instead of holding a connection through it.
+    """
+    async with async_session_maker() as db:
+        yield AskService(repo=ConversationRepository(db), db=db)
+
 
 class AskService:
 
@@ -18,61 +108,161 @@ class AskService:
 
     # ── Session helpers ───────────────────────────────────────────────────────
 
-    async def get_or_create_session(
-        self, user_id: str, session_id: str | None
-    ) -> ConversationSession:
-        """Return an existing session (owned by user) or create a new unnamed one."""
-        if session_id:
-            session = await self.repo.get_session(session_id, user_id)
-            if session:
-                return session
-        return await self.repo.create_session(user_id)
+    def _cache_history(self, session_id: str, history: list[dict], limit: int) -> None:
+        # Only a full window (or the whole session) is a complete cache entry
+        if limit >= history_cache.max_messages or len(history) < limit:
+            history_cache.put(session_id, history)
 
     async def load_history(
-        self, session_id: str, limit: int = 20
+        self, session_id: str, limit: int = Settings.HISTORY_CACHE_MESSAGES
     ) -> list[dict]:
-        """Return the last `limit` messages as plain dicts for the graph."""
+        """
+        Return the last `limit` messages as plain dicts for the graph.
+        Each node then trims them to its own token budget (graph/history_window.py).
+        """
+        cached = history_cache.get(session_id, limit)
+        if cached is not None:
+            return cached
         msgs = await self.repo.get_recent_messages(session_id, limit)
-        return [{"role": m.role.value, "content": m.content} for m in msgs]
+        history = [{"id": m.id, "role": m.role.value, "content": m.content} for m in msgs]
+        self._cache_history(session_id, history, limit)
+        return history
+
+    async def begin_turn(
+        self,
+        user_id: str,
+        session_id: str | None,
+        with_context: bool = True,
+        limit: int = Settings.HISTORY_CACHE_MESSAGES,
+    ) -> tuple[ConversationSession, str | None, list[dict]]:
+        """
+        Read side of a turn: at most one query. The ownership check and, on a
+        history cache miss, the recent messages come back together; a new
+        session is only built in memory and inserted by save_turn().
+        Returns (session, summary, history not yet covered by the summary).
+        """
+        with count_round_trips() as trips:
+            session, history = None, []
+            if session_id:
+                cached = history_cache.get(session_id, limit) if with_context else None
+                if cached is not None or not with_context:
+                    session = await self.repo.get_session(session_id, user_id)
+                    history = cached or []
+                else:
+                    session, history = await self.repo.get_session_with_history(session_id, user_id, limit)
+                    if session is not None:
+                        self._cache_history(session_id, history, limit)
+            if session is None:
+                session = self.repo.new_session(user_id)
+                history = []
+                history_cache.put(session.id, [])
+        metrics.observe("ask.turn.read_round_trips", trips.count)
+        return session, session.summary, self._unsummarized(session, history)
 
     async def save_turn(
-        self, session_id: str, query: str, answer: str, source: str | None = None
+        self,
+        session: ConversationSession,
+        query: str,
+        answer: str,
+        source: str | None = None,
+        title: str | None = None,
     ) -> None:
-        """Persist a human + assistant message pair, then commit."""
-        await self.repo.add_message(session_id, MessageRole.HUMAN, query)
-        await self.repo.add_message(session_id, MessageRole.ASSISTANT, answer, source=source)
-        await self.db.commit()
+        """
+        Write side of a turn in one transaction: the session insert or
+        activity update (with the first-turn title) and a single multi-row
+        insert of the human + assistant messages, then commit.
+        """
+        human = self.repo.build_message(session.id, MessageRole.HUMAN, query)
+        assistant = self.repo.build_message(session.id, MessageRole.ASSISTANT, answer, source=source)
+        preview = " ".join(answer.split())
+        if len(preview) > PREVIEW_CHARS:
+            preview = preview[:PREVIEW_CHARS - 1] + "…"
+        with count_round_trips() as trips:
+            await self.repo.record_turn(session, [human, assistant], preview, name=title)
+            await self.db.commit()
+        metrics.observe("ask.turn.write_round_trips", trips.count)
+        history_cache.append(session.id, [
+            {"id": m["id"], "role": m["role"].value, "content": m["content"]}
+            for m in (human, assistant)
+        ])
 
-    async def maybe_set_title(
-        self, session: ConversationSession, query: str, answer: str
-    ) -> None:
-        """Generate and persist a title on the first turn (when still unnamed)."""
-        if session.name is not None:
+    async def complete_turn(
+        self,
+        session: ConversationSession,
+        query: str,
+        answer: str,
+        source: str | None = None,
+    ) -> asyncio.Future | None:
+        """
+        save_turn() plus post-turn work. On a session's first turn a local
+        title is stored with the turn (TITLE_STRATEGY local / hybrid) and an
+        LLM title is queued (llm, or sampled hybrid); a summary refresh is
+        queued when due. Returns the LLM title job's future, if any.
+        """
+        unnamed = session.name is None
+        placeholder = None
+        if unnamed and Settings.TITLE_STRATEGY != "llm":
+            placeholder = local_conversation_title(query, answer)
+            metrics.incr("title.local")
+        await self.save_turn(session, query, answer, source=source, title=placeholder)
+        await self.maybe_refresh_summary(session)
+        return schedule_title(session.id, query, answer, placeholder) if unnamed else None
+
+    @staticmethod
+    def _unsummarized(session: ConversationSession, history: list[dict]) -> list[dict]:
+        if session.summary_until:
+            return [h for h in history if h["id"] > session.summary_until]
+        return history
+
+    async def load_context(
+        self, session: ConversationSession
+    ) -> tuple[str | None, list[dict]]:
+        """Return (rolling summary, recent messages not yet covered by it)."""
+        history = await self.load_history(session.id)
+        return session.summary, self._unsummarized(session, history)
+
+    async def maybe_refresh_summary(self, session: ConversationSession) -> None:
+        """Refresh the summary in the background once the unsummarized tail is long."""
+        _, tail = await self.load_context(session)
+        if len(tail) < Settings.SUMMARY_TRIGGER_MESSAGES:
             return
-        try:
-            title = await generate_conversation_title(query, answer)
-            await self.repo.set_session_name(session, title)
-            await self.db.commit()
-            await self.db.refresh(session)
-        except Exception as exc:
-            logger.warning("Title generation failed: %s", exc)
+        job_queue.submit("summary", session.id, _refresh_summary, session.id)
 
     # ── Session CRUD ──────────────────────────────────────────────────────────
 
-    async def list_sessions(self, user_id: str) -> list[ConversationSession]:
-        return await self.repo.list_sessions_for_user(user_id)
+    async def list_sessions(
+        self, user_id: str, limit: int, before: str | None = None
+    ) -> tuple[list[ConversationSession], str | None]:
+        """Return one page of sessions (most recent activity first) and the next cursor."""
+        sessions, has_more = await self.repo.list_sessions_for_user(user_id, limit, before)
+        next_cursor = sessions[-1].id if has_more and sessions else None
+        return sessions, next_cursor
 
     async def get_session_messages(
-        self, session_id: str, user_id: str
-    ) -> list[ConversationMessage]:
-        """Return all messages in a session, verifying ownership."""
+        self,
+        session_id: str,
+        user_id: str,
+        limit: int,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> tuple[list[ConversationMessage], str | None]:
+        """Return one page of a session's messages and the next cursor, verifying ownership."""
+        if before is not None and after is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either 'before' or 'after', not both",
+            )
         session = await self.repo.get_session(session_id, user_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Session not found",
             )
-        return await self.repo.get_all_messages(session_id)
+        msgs, has_more = await self.repo.get_messages_page(session_id, limit, before, after)
+        next_cursor = None
+        if has_more and msgs:
+            next_cursor = msgs[-1].id if after is not None else msgs[0].id
+        return msgs, next_cursor
 
     async def rename_session(self, session_id: str, user_id: str, new_name: str) -> ConversationSession:
         """Rename a session, verifying ownership."""
@@ -97,3 +287,4 @@ class AskService:
             )
         await self.repo.delete_session(session)
         await self.db.commit()
+        history_cache.invalidate(session_id)
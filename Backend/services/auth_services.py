@@ -1,9 +1,11 @@
+from core import metrics
 from exceptions import UserAlreadyExistsException, InvalidCredentialsException
 from models import Users
 from repository import UserRepository
 from repository.refresh_tokens_repository import RefreshTokensRepository
 from schema import CreateUser
 from security import hash_password, verify_password, create_access_token, create_refresh_token, verify_refresh_token
+from security.principal import invalidate_principal
 from fastapi import HTTPException, status
 import logging
 
@@ -24,17 +26,27 @@ class AuthServices:
 
         new_user = Users(
             email=user.email,
-            password=hash_password(user.password)
+            password=await hash_password(user.password)
         )
 
         return await self.user_repo.create_user(new_user)
 
     async def login_user(self, user: CreateUser):
         existing_user = await self.user_repo.get_user_by_email(str(user.email))
-        if existing_user is None or not verify_password(plain_text=user.password, hashed_pwd=existing_user.password):
+        if existing_user is None:
             raise InvalidCredentialsException(
                 "Invalid email or password"
             )
+        valid, new_hash = await verify_password(plain_text=user.password, hashed_pwd=existing_user.password)
+        if not valid:
+            raise InvalidCredentialsException(
+                "Invalid email or password"
+            )
+        if new_hash is not None:
+            # Argon2 parameters changed since this hash was made; upgrade it
+            existing_user.password = new_hash
+            metrics.incr("auth.password.rehashed")
+            logger.info("Upgraded password hash for user_id=%s", existing_user.id)
         payload = {"sub": existing_user.id}
         access_token = create_access_token(data=payload)
         refresh_token = create_refresh_token(data=payload)
@@ -70,6 +82,7 @@ class AuthServices:
                 "Revoking all sessions.", stored.user_id
             )
             await self.refresh_repo.delete_all_for_user(stored.user_id)
+            invalidate_principal(stored.user_id)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Refresh token reuse detected. All sessions revoked. Please log in again.",
@@ -90,4 +103,5 @@ class AuthServices:
     async def logout_user(self, user_id: str) -> None:
         """Revoke all server-side refresh tokens for the user."""
         await self.refresh_repo.delete_all_for_user(user_id)
+        invalidate_principal(user_id)
 
@@ -0,0 +1,85 @@
+"""
+History cache — write-through, per-session ring buffer of recent messages.
+
+AskService fills a session's buffer from the DB on first load, appends each
+saved turn after it commits and drops the buffer when the session is
+deleted, so steady-state turns read history without a query. Buffers hold
+at most `max_messages` each; the whole cache is bounded by an approximate
+byte budget and evicts least-recently used sessions first.
+
+The cache is per worker process. A session written by another worker is
+only picked up after its buffer here is evicted.
+"""
+from collections import OrderedDict, deque
+
+from core import Settings, metrics
+
+# Rough per-message overhead for dict + deque slot, added to content length
+_MESSAGE_OVERHEAD_BYTES = 64
+
+
+def _size(message: dict) -> int:
+    return len(message["content"]) + _MESSAGE_OVERHEAD_BYTES
+
+
+class HistoryCache:
+
+    def __init__(self, max_messages: int, max_bytes: int):
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self._buffers: OrderedDict[str, deque[dict]] = OrderedDict()
+        self._bytes: dict[str, int] = {}
+        self._total_bytes = 0
+
+    def get(self, session_id: str, limit: int) -> list[dict] | None:
+        """Return the last `limit` messages, or None if not cached/too short."""
+        buffer = self._buffers.get(session_id)
+        if buffer is None or limit > self.max_messages:
+            metrics.incr("cache.history.miss")
+            return None
+        self._buffers.move_to_end(session_id)
+        metrics.incr("cache.history.hit")
+        return list(buffer)[-limit:]
+
+    def put(self, session_id: str, messages: list[dict]) -> None:
+        """Replace a session's buffer with (the tail of) `messages`."""
+        if self.max_messages <= 0:
+            return
+        self.invalidate(session_id)
+        self._buffers[session_id] = deque(maxlen=self.max_messages)
+        self._bytes[session_id] = 0
+        self._append(session_id, messages)
+
+    def append(self, session_id: str, messages: list[dict]) -> None:
+        """Append newly persisted messages if the session is cached."""
+        if session_id in self._buffers:
+            self._buffers.move_to_end(session_id)
+            self._append(session_id, messages)
+
+    def invalidate(self, session_id: str) -> None:
+        if self._buffers.pop(session_id, None) is not None:
+            self._total_bytes -= self._bytes.pop(session_id)
+
+    def _append(self, session_id: str, messages: list[dict]) -> None:
+        buffer = self._buffers[session_id]
+        for message in messages:
+            if len(buffer) == buffer.maxlen:
+                dropped = _size(buffer[0])
+                self._bytes[session_id] -= dropped
+                self._total_bytes -= dropped
+            buffer.append(message)
+            self._bytes[session_id] += _size(message)
+            self._total_bytes += _size(message)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._buffers:
+            session_id, _ = self._buffers.popitem(last=False)
+            self._total_bytes -= self._bytes.pop(session_id)
+            metrics.incr("cache.history.evicted")
+
+
+history_cache = HistoryCache(
+    max_messages=Settings.HISTORY_CACHE_MESSAGES,
+    max_bytes=Settings.HISTORY_CACHE_MAX_BYTES,
+)
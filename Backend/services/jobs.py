@@ -0,0 +1,120 @@
+"""
+Job queue — bounded, in-process queue for post-turn background work.
+
+Titles and summary refreshes run here instead of in bare create_task()s:
+
+  * a fixed pool of JOB_WORKERS workers bounds concurrent LLM calls
+  * at most JOB_QUEUE_MAX_DEPTH jobs wait; submissions beyond that are
+    dropped (the work is best-effort and retried on a later turn)
+  * a job with the same (kind, key) already queued or running is not
+    queued again; the caller gets the existing job's future
+  * failures are retried up to JOB_MAX_ATTEMPTS times with exponential
+    backoff starting at JOB_RETRY_BACKOFF_SECONDS
+
+Job functions open their own DB sessions; nothing request-scoped is passed
+in. Each submit() returns a future resolving to the job's return value,
+or None if the job failed.
+
+Metrics (per job kind):
+  jobs.<kind>.submitted / deduped / dropped / retried / succeeded / failed
+  jobs.<kind>.queue_wait_ms   time from submit until a worker picked it up
+  jobs.<kind>.run_ms          duration of a successful run, retries included
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from core import Settings, metrics
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+
+    def __init__(self, workers: int, max_depth: int, max_attempts: int, backoff: float):
+        self.workers = workers
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_depth)
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(), name=f"jobs-worker-{i}"))
+
+    async def stop(self) -> None:
+        """Cancel the workers; queued jobs are discarded."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self._queue.qsize():
+            logger.info("Discarding %d queued background jobs", self._queue.qsize())
+
+    # ── Submission ────────────────────────────────────────────────────────────
+
+    def submit(
+        self, kind: str, key: str, fn: Callable[..., Awaitable[Any]], *args: Any
+    ) -> asyncio.Future | None:
+        """Queue fn(*args) unless an identical job is pending; None if the queue is full."""
+        job_key = (kind, key)
+        existing = self._inflight.get(job_key)
+        if existing is not None:
+            metrics.incr(f"jobs.{kind}.deduped")
+            return existing
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((kind, key, fn, args, future, time.perf_counter()))
+        except asyncio.QueueFull:
+            metrics.incr(f"jobs.{kind}.dropped")
+            logger.warning("Job queue full, dropping %s job for %s", kind, key)
+            return None
+        self._inflight[job_key] = future
+        metrics.incr(f"jobs.{kind}.submitted")
+        return future
+
+    # ── Workers ───────────────────────────────────────────────────────────────
+
+    async def _worker(self) -> None:
+        while True:
+            kind, key, fn, args, future, queued_at = await self._queue.get()
+            metrics.observe(f"jobs.{kind}.queue_wait_ms", (time.perf_counter() - queued_at) * 1000)
+            try:
+                result = await self._run(kind, fn, args)
+                metrics.incr(f"jobs.{kind}.succeeded")
+            except Exception as exc:
+                metrics.incr(f"jobs.{kind}.failed")
+                logger.warning("%s job for %s failed after %d attempts: %s", kind, key, self.max_attempts, exc)
+                result = None
+            finally:
+                self._inflight.pop((kind, key), None)
+                self._queue.task_done()
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self, kind: str, fn: Callable[..., Awaitable[Any]], args: tuple) -> Any:
+        start = time.perf_counter()
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                result = await fn(*args)
+                break
+            except Exception:
+                if attempt == self.max_attempts:
+                    raise
+                metrics.incr(f"jobs.{kind}.retried")
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+        metrics.observe(f"jobs.{kind}.run_ms", (time.perf_counter() - start) * 1000)
+        return result
+
+
+job_queue = JobQueue(
+    workers=Settings.JOB_WORKERS,
+    max_depth=Settings.JOB_QUEUE_MAX_DEPTH,
+    max_attempts=Settings.JOB_MAX_ATTEMPTS,
+    backoff=Settings.JOB_RETRY_BACKOFF_SECONDS,
+)
@@ -0,0 +1,212 @@
+"""
+Stream runs — resumable SSE answers backed by in-memory replay buffers.
+
+Each /ask/stream request starts a run: a background task that drives the
+answer stream and appends every frame to the run's buffer. Connections
+only read from the buffer, so a client that drops can reconnect with the
+run id and the last event id it saw and continue where it left off, while
+the run is still generating or after it finished, without another LLM
+call. Frames are sent with `id: <run_id>:<seq>`, seq counting from 1.
+
+Lifetime and memory:
+  * when the last reader of an unfinished run disconnects, the run is
+    cancelled after STREAM_RESUME_GRACE_SECONDS unless a reader returns
+    (0 cancels at once)
+  * finished runs are dropped STREAM_RUN_RETENTION_SECONDS after finishing
+  * one run buffers at most STREAM_RUN_MAX_BYTES; beyond that its oldest
+    frames are dropped and resuming from before them is refused
+  * all buffers together are bounded by STREAM_RUNS_MAX_BYTES; finished
+    runs are evicted oldest first to stay under it
+
+The registry is per worker process; a reconnect must reach the same worker.
+
+Metrics: stream_runs.started / resumed / evicted / expired / orphaned,
+stream_runs.bytes (buffered bytes, sampled per finished run).
+"""
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from typing import AsyncIterator
+
+import uuid6
+
+from core import Settings, metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayUnavailable(Exception):
+    """The requested events were already dropped from the run's buffer."""
+
+
+class StreamRun:
+
+    def __init__(self, registry: "StreamRunRegistry", run_id: str, user_id: str):
+        self.registry = registry
+        self.run_id = run_id
+        self.user_id = user_id
+        self.size = 0
+        self.done = False
+        self._frames: deque[bytes] = deque()
+        self._first_seq = 1            # seq of self._frames[0]
+        self._changed = asyncio.Event()
+        self._readers = 0
+        self._orphan_timer: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def last_seq(self) -> int:
+        return self._first_seq + len(self._frames) - 1
+
+    # ── Writer side ───────────────────────────────────────────────────────────
+
+    def append(self, frame: bytes) -> None:
+        self._frames.append(frame)
+        self.size += len(frame)
+        self.registry.used += len(frame)
+        while self.size > self.registry.run_max_bytes and len(self._frames) > 1:
+            dropped = self._frames.popleft()
+            self._first_seq += 1
+            self.size -= len(dropped)
+            self.registry.used -= len(dropped)
+        self._notify()
+
+    def finish(self) -> None:
+        self.done = True
+        self._notify()
+
+    def cancel(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    # ── Reader side ───────────────────────────────────────────────────────────
+
+    def read(self, after: int = 0) -> AsyncIterator[bytes]:
+        """
+        Id-tagged frames with seq > `after`, following the run live.
+        Raises ReplayUnavailable if some of them were already trimmed.
+        """
+        if after + 1 < self._first_seq:
+            raise ReplayUnavailable(self.run_id)
+        return self._follow(after + 1)
+
+    async def _follow(self, seq: int) -> AsyncIterator[bytes]:
+        self._attach()
+        try:
+            while True:
+                changed = self._changed
+                while seq <= self.last_seq:
+                    if seq < self._first_seq:
+                        # Trimmed while this reader lagged; the reconnect gets 410
+                        return
+                    frame = self._frames[seq - self._first_seq]
+                    yield b"id: %s:%d\n%s" % (self.run_id.encode(), seq, frame)
+                    seq += 1
+                if self.done:
+                    return
+                await changed.wait()
+        finally:
+            self._detach()
+
+    def _attach(self) -> None:
+        self._readers += 1
+        if self._orphan_timer is not None:
+            self._orphan_timer.cancel()
+            self._orphan_timer = None
+
+    def _detach(self) -> None:
+        self._readers -= 1
+        if self._readers == 0 and not self.done:
+            self._orphan_timer = asyncio.get_running_loop().call_later(
+                self.registry.grace, self._cancel_if_orphaned
+            )
+
+    def _cancel_if_orphaned(self) -> None:
+        self._orphan_timer = None
+        if self._readers == 0 and not self.done:
+            metrics.incr("stream_runs.orphaned")
+            self.cancel()
+
+
+class StreamRunRegistry:
+
+    def __init__(self, max_bytes: int, run_max_bytes: int, retention: float, grace: float):
+        self.max_bytes = max_bytes
+        self.run_max_bytes = run_max_bytes
+        self.retention = retention
+        self.grace = grace
+        self.used = 0
+        self._runs: OrderedDict[str, StreamRun] = OrderedDict()
+
+    def create(self, user_id: str) -> StreamRun:
+        """Register a new run; start() it right away with the stream it carries."""
+        run = StreamRun(self, str(uuid6.uuid7()), user_id)
+        self._runs[run.run_id] = run
+        metrics.incr("stream_runs.started")
+        return run
+
+    def start(self, run: StreamRun, stream: AsyncIterator[bytes]) -> None:
+        """Drive `stream` into the run's buffer in a background task."""
+        run._task = asyncio.create_task(self._drive(run, stream), name=f"stream-run-{run.run_id}")
+
+    async def close(self) -> None:
+        """Cancel unfinished runs (called on app shutdown)."""
+        tasks = [run._task for run in self._runs.values() if run._task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._runs.clear()
+        self.used = 0
+
+    def get(self, run_id: str, user_id: str) -> StreamRun | None:
+        """A live or retained run, only for the user who started it."""
+        run = self._runs.get(run_id)
+        if run is None or run.user_id != user_id:
+            return None
+        metrics.incr("stream_runs.resumed")
+        return run
+
+    async def _drive(self, run: StreamRun, stream: AsyncIterator[bytes]) -> None:
+        try:
+            async for frame in stream:
+                run.append(frame)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Stream run %s failed", run.run_id)
+        finally:
+            run.finish()
+            metrics.observe("stream_runs.bytes", run.size)
+            asyncio.get_running_loop().call_later(self.retention, self._expire, run.run_id)
+            self._evict()
+
+    def _expire(self, run_id: str) -> None:
+        if self._remove(run_id):
+            metrics.incr("stream_runs.expired")
+
+    def _remove(self, run_id: str) -> bool:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return False
+        self.used -= run.size
+        return True
+
+    def _evict(self) -> None:
+        """Drop finished runs, oldest first, while over the global budget."""
+        for run_id in [r.run_id for r in self._runs.values() if r.done]:
+            if self.used <= self.max_bytes:
+                break
+            self._remove(run_id)
+            metrics.incr("stream_runs.evicted")
+
+
+stream_runs = StreamRunRegistry(
+    max_bytes=Settings.STREAM_RUNS_MAX_BYTES,
+    run_max_bytes=Settings.STREAM_RUN_MAX_BYTES,
+    retention=Settings.STREAM_RUN_RETENTION_SECONDS,
+    grace=Settings.STREAM_RESUME_GRACE_SECONDS,
+)
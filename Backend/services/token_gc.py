@@ -0,0 +1,59 @@
+"""
+Refresh-token garbage collector — periodically deletes dead refresh tokens.
+
+A row is dead once its expiry has passed (the JWT itself is rejected from
+then on), or once it has been revoked for longer than the retention window.
+Revoked rows are kept that long so a replayed, rotated token still triggers
+reuse detection in AuthServices.refresh_tokens().
+
+Deletes run in batches of TOKEN_GC_BATCH_SIZE rows, each in its own short
+transaction, so a large backlog never holds long locks on the table.
+
+Metrics:
+  auth.token_gc.pruned   rows deleted
+  auth.token_gc.run_ms   duration of one full collection pass
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from core import Settings, metrics
+from core.database import async_session_maker
+from repository.refresh_tokens_repository import RefreshTokensRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def prune_refresh_tokens() -> int:
+    """Delete all currently dead refresh tokens in bounded batches."""
+    start = time.perf_counter()
+    now = datetime.now(timezone.utc)
+    revoked_before = now - timedelta(minutes=Settings.TOKEN_GC_REVOKED_RETENTION_MINUTES)
+    total = 0
+    while True:
+        async with async_session_maker() as db:
+            deleted = await RefreshTokensRepository(db).delete_prunable(
+                now, revoked_before, Settings.TOKEN_GC_BATCH_SIZE
+            )
+            await db.commit()
+        total += deleted
+        metrics.incr("auth.token_gc.pruned", deleted)
+        if deleted < Settings.TOKEN_GC_BATCH_SIZE:
+            break
+        # Let request traffic in between batches
+        await asyncio.sleep(0)
+    metrics.observe("auth.token_gc.run_ms", (time.perf_counter() - start) * 1000)
+    if total:
+        logger.info("Pruned %d refresh tokens", total)
+    return total
+
+
+async def run_token_gc() -> None:
+    """Prune on startup and then every TOKEN_GC_INTERVAL_SECONDS until cancelled."""
+    while True:
+        try:
+            await prune_refresh_tokens()
+        except Exception:
+            logger.exception("Refresh token garbage collection failed")
+        await asyncio.sleep(Settings.TOKEN_GC_INTERVAL_SECONDS)
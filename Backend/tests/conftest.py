@@ -0,0 +1,12 @@
+import os
+import sys
+
+# Settings are read at import time; the tests never connect to MySQL or Groq
+os.environ.setdefault("DB_USER", "test")
+os.environ.setdefault("DB_PASSWORD", "test")
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_PORT", "3306")
+os.environ.setdefault("DB_NAME", "nova_test")
+os.environ.setdefault("GROQ_API_KEY", "test")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
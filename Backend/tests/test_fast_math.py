@@ -0,0 +1,50 @@
+"""
+Fast math path: answers self-contained arithmetic, declines anything that
+only looks like it (phone numbers, ranges, ratios, dates, bare numbers).
+"""
+import pytest
+
+from graph.fast_math import solve_math
+
+
+@pytest.mark.parametrize("query, result", [
+    ("what is 12 * 4 + sqrt(81)", "57"),
+    ("3 + 5", "8"),
+    ("calculate 10 - 4", "6"),
+    ("10 / 4 =", "2.5"),
+    ("what is sqrt(16)", "4"),
+    ("what is 2^10", "1024"),
+])
+def test_answers_arithmetic(query, result):
+    answer = solve_math(query)
+    assert answer is not None and answer.endswith(f"**{result}**")
+
+
+def test_answers_area():
+    assert solve_math("area of a circle with radius 1") == "The area of the circle is **3.141592654**."
+
+
+@pytest.mark.parametrize("query", [
+    # phone numbers
+    "555-1234",
+    "call me at 555-1234",
+    "555-123-4567",
+    # year ranges
+    "1939-1945",
+    "what happened in 1939-1945",
+    # dates
+    "2024-01-15",
+    "3/4/2024",
+    "15/01/2024",
+    # ratios
+    "24/7",
+    "what is 24/7",
+    "the 80/20 rule",
+    # nothing to compute
+    "what is -5",
+    "(3)",
+    # non-real result
+    "what is (-8)^0.5",
+])
+def test_declines_non_arithmetic(query):
+    assert solve_math(query) is None
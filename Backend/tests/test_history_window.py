@@ -0,0 +1,31 @@
+"""
+History window: newest messages first within the token budget, and the
+sent/saved metrics report the tokens of the messages actually selected.
+"""
+from core import metrics
+from graph.history_window import count_tokens, select_history
+
+
+def _message(tokens: int) -> dict:
+    return {"role": "user", "content": " ".join(["abcde"] * tokens)}
+
+
+def test_stops_when_only_a_sliver_fits():
+    metrics.reset()
+    history = [_message(20), _message(200), _message(100)]
+    selected = select_history(history, 150, "test_node")
+
+    assert selected == [history[-1]]
+    assert metrics.mean("history.test_node.tokens_sent") == 100
+    assert metrics.mean("history.test_node.tokens_saved") == 220
+
+
+def test_truncates_an_older_message_to_fill_the_budget():
+    metrics.reset()
+    history = [_message(300), _message(100)]
+    selected = select_history(history, 250, "test_node")
+
+    assert len(selected) == 2 and selected[1] == history[1]
+    assert count_tokens(selected[0]["content"]) < 300
+    assert metrics.mean("history.test_node.tokens_sent") == 250
+    assert metrics.mean("history.test_node.tokens_saved") == 150
@@ -0,0 +1,37 @@
+"""
+Local-mode MCP tools validate arguments like the SSE server does: strings
+are coerced by the tool's argument model, invalid or missing arguments
+raise ToolException instead of reaching the math functions.
+"""
+import asyncio
+
+import pytest
+from langchain_core.tools import ToolException
+
+from graph.mcp_client import load_local_tools
+
+
+def _tools() -> dict:
+    tools = asyncio.run(load_local_tools("mcp_servers.math_mcp_server"))
+    return {tool.name: tool for tool in tools}
+
+
+def test_string_arguments_are_coerced():
+    tools = _tools()
+    assert asyncio.run(tools["add"].ainvoke({"a": "2", "b": "3"})) == 5.0
+    assert asyncio.run(tools["multiply"].ainvoke({"a": "2", "b": 3})) == 6.0
+
+
+@pytest.mark.parametrize("arguments", [{"a": "x", "b": 1}, {"a": 2}, {}])
+def test_invalid_or_missing_arguments_raise(arguments):
+    with pytest.raises(ToolException):
+        asyncio.run(_tools()["add"].ainvoke(arguments))
+
+
+def test_tool_errors_raise():
+    with pytest.raises(ToolException, match="divide by zero"):
+        asyncio.run(_tools()["divide"].ainvoke({"a": 1, "b": 0}))
+
+
+def test_batch_tool_is_hidden():
+    assert "batch" not in _tools()
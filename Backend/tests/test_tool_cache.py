@@ -0,0 +1,27 @@
+"""
+Tool result cache: only allowlisted tools that are also annotated read-only
+and idempotent are memoized.
+"""
+import asyncio
+
+from mcp.types import ToolAnnotations
+
+from graph.mcp_client import load_local_tools
+from graph.tool_cache import deterministic_metadata
+
+PURE = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
+
+def test_allowlisted_pure_tool_is_cacheable():
+    assert deterministic_metadata("add", PURE) == {"deterministic": True}
+
+
+def test_unlisted_or_unannotated_tool_is_not_cacheable():
+    assert deterministic_metadata("get_random_joke", PURE) == {"deterministic": False}
+    assert deterministic_metadata("add", ToolAnnotations(readOnlyHint=True)) == {"deterministic": False}
+    assert deterministic_metadata("add", None) == {"deterministic": False}
+
+
+def test_local_math_tools_are_cacheable():
+    tools = asyncio.run(load_local_tools("mcp_servers.math_mcp_server"))
+    assert tools and all(tool.metadata == {"deterministic": True} for tool in tools)
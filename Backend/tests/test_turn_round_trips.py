@@ -0,0 +1,78 @@
+"""
+DB round trips per turn: begin_turn() reads with at most one query and
+save_turn() writes with at most three (session insert or update, one
+multi-row message insert, commit). Runs against in-memory SQLite.
+"""
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from core import Base
+from core.database import count_round_trips, track_round_trips
+from repository.conversation_repository import ConversationRepository
+from services.ask_service import AskService
+from services.history_cache import history_cache
+
+MAX_READ_ROUND_TRIPS = 1
+MAX_WRITE_ROUND_TRIPS = 3
+
+USER_ID = "user-1"
+
+
+async def _session_maker():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    track_round_trips(engine.sync_engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+async def _begin(maker, session_id, with_context=True):
+    async with maker() as db:
+        service = AskService(repo=ConversationRepository(db), db=db)
+        with count_round_trips() as trips:
+            session, _, history = await service.begin_turn(USER_ID, session_id, with_context=with_context)
+    return session, history, trips.count
+
+
+async def _save(maker, session, query, answer):
+    async with maker() as db:
+        service = AskService(repo=ConversationRepository(db), db=db)
+        with count_round_trips() as trips:
+            await service.save_turn(session, query, answer, source="chat", title="Test")
+    return trips.count
+
+
+def test_turn_round_trips():
+    async def run():
+        engine, maker = await _session_maker()
+        try:
+            # First turn: the new session is built in memory, inserted on save
+            session, history, reads = await _begin(maker, None)
+            assert reads == 0
+            assert history == []
+            writes = await _save(maker, session, "hi", "hello")
+            assert writes <= MAX_WRITE_ROUND_TRIPS
+
+            # Follow-up turn with a cold history cache: one joined query
+            history_cache.invalidate(session.id)
+            session, history, reads = await _begin(maker, session.id)
+            assert reads <= MAX_READ_ROUND_TRIPS
+            assert [h["content"] for h in history] == ["hi", "hello"]
+            writes = await _save(maker, session, "and again", "hello again")
+            assert writes <= MAX_WRITE_ROUND_TRIPS
+
+            # Warm history cache: only the ownership check
+            session, history, reads = await _begin(maker, session.id)
+            assert reads <= MAX_READ_ROUND_TRIPS
+            assert len(history) == 4
+
+            # Unknown session for this user: falls back to a new one
+            session, history, reads = await _begin(maker, "missing")
+            assert reads <= MAX_READ_ROUND_TRIPS
+            assert session.id != "missing" and history == []
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
@@ -9,11 +9,17 @@ export default function Dashboard({ userEmail, onLogout }) {
     const {
         activeSessionId,
         sessions,
+        hasMoreSessions,
+        loadingMoreSessions,
+        loadMoreSessions,
         messages,
         input,
         setInput,
         streaming,
         loadingSession,
+        hasOlderMessages,
+        loadingOlderMessages,
+        loadOlderMessages,
         newChat,
         openSession,
         deleteSession,
@@ -51,6 +57,9 @@ export default function Dashboard({ userEmail, onLogout }) {
                 userEmail={userEmail}
                 initials={initials}
                 sessions={sessions}
+                hasMoreSessions={hasMoreSessions}
+                loadingMoreSessions={loadingMoreSessions}
+                loadMoreSessions={loadMoreSessions}
                 activeSessionId={activeSessionId}
                 mobileSidebarOpen={mobileSidebarOpen}
                 setMobileSidebarOpen={setMobileSidebarOpen}
@@ -67,6 +76,9 @@ export default function Dashboard({ userEmail, onLogout }) {
                 setInput={setInput}
                 streaming={streaming}
                 loadingSession={loadingSession}
+                hasOlderMessages={hasOlderMessages}
+                loadingOlderMessages={loadingOlderMessages}
+                loadOlderMessages={loadOlderMessages}
                 send={send}
                 initials={initials}
                 mobileSidebarOpen={mobileSidebarOpen}
@@ -10,6 +10,9 @@ export default function ChatArea({
     setInput,
     streaming,
     loadingSession,
+    hasOlderMessages,
+    loadingOlderMessages,
+    loadOlderMessages,
     send,
     initials,
     mobileSidebarOpen,
@@ -22,10 +25,11 @@ export default function ChatArea({
     const textareaRef = useRef(null);
     const messagesEndRef = useRef(null);
 
-    // Auto-scroll
+    // Auto-scroll when the newest message changes, not when older ones are prepended
+    const lastMessage = messages[messages.length - 1];
     useEffect(() => {
         messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
-    }, [messages, streaming]);
+    }, [lastMessage, streaming]);
 
     const handleKey = (e) => {
         if (e.key === "Enter" && !e.shiftKey) {
@@ -121,6 +125,15 @@ export default function ChatArea({
                     </div>
                 ) : (
                     <div className="messages-wrap">
+                        {hasOlderMessages && (
+                            <button
+                                className="load-older-btn"
+                                disabled={loadingOlderMessages}
+                                onClick={loadOlderMessages}
+                            >
+                                {loadingOlderMessages ? "Loading…" : "Load earlier messages"}
+                            </button>
+                        )}
                         {messages.map((m, i) => (
                             <div key={i} className={`message-row ${m.role === "user" ? "user" : ""}`}>
                                 <div className={`msg-avatar ${m.role === "ai" ? "ai" : "human"}`}>
@@ -134,7 +147,8 @@ export default function ChatArea({
                                                 <span className={`source-badge source-badge--${m.source}`}>
                                                     {m.source === "mcp_joke" ? "🎭 MCP Joke"
                                                         : m.source === "mcp_math" ? "🔢 MCP Math"
-                                                            : "💬 Chat"}
+                                                            : m.source === "partial" ? "✂️ Interrupted"
+                                                                : "💬 Chat"}
                                                 </span>
                                             )}
                                         </div>
@@ -4,6 +4,9 @@ export default function Sidebar({
     userEmail,
     initials,
     sessions,
+    hasMoreSessions,
+    loadingMoreSessions,
+    loadMoreSessions,
     activeSessionId,
     mobileSidebarOpen,
     setMobileSidebarOpen,
@@ -12,6 +15,14 @@ export default function Sidebar({
     deleteSession,
     onLogout
 }) {
+    // Infinite scroll: fetch the next page when the list nears its end
+    const handleListScroll = (e) => {
+        const el = e.currentTarget;
+        if (hasMoreSessions && el.scrollHeight - el.scrollTop - el.clientHeight < 80) {
+            loadMoreSessions();
+        }
+    };
+
     return (
         <>
             {mobileSidebarOpen && (
@@ -37,7 +48,7 @@ export default function Sidebar({
 
                 <div className="sidebar-section-label">Recents</div>
 
-                <div className="sidebar-list">
+                <div className="sidebar-list" onScroll={handleListScroll}>
                     {sessions.length === 0 && (
                         <div className="sidebar-empty">No conversations yet</div>
                     )}
@@ -63,6 +74,15 @@ export default function Sidebar({
                             </button>
                         </div>
                     ))}
+                    {hasMoreSessions && (
+                        <button
+                            className="sidebar-load-more"
+                            disabled={loadingMoreSessions}
+                            onClick={loadMoreSessions}
+                        >
+                            {loadingMoreSessions ? "Loading…" : "Load more"}
+                        </button>
+                    )}
                 </div>
 
                 <div className="sidebar-bottom">
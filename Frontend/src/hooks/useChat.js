@@ -10,39 +10,74 @@ import {
 export function useChat() {
     const [activeSessionId, setActiveSessionId] = useState(null);
     const [sessions, setSessions] = useState([]);         // [{ id, name, created_at }]
+    const [sessionsCursor, setSessionsCursor] = useState(null);
+    const [loadingMoreSessions, setLoadingMoreSessions] = useState(false);
     const [messages, setMessages] = useState([]);         // [{ role: "user"|"ai", text }]
     const [input, setInput] = useState("");
     const [streaming, setStreaming] = useState(false);
     const [loadingSession, setLoadingSession] = useState(false);
+    const [olderMessagesCursor, setOlderMessagesCursor] = useState(null);
+    const [loadingOlderMessages, setLoadingOlderMessages] = useState(false);
 
     const streamControllerRef = useRef(null);
+    const activeSessionRef = useRef(null);     // current value for async callbacks
+
+    useEffect(() => {
+        activeSessionRef.current = activeSessionId;
+    }, [activeSessionId]);
 
     // ── Load sessions on mount ────────────────────────────────────────────────
     useEffect(() => {
         apiListSessions()
-            .then(setSessions)
+            .then((page) => {
+                setSessions(page.sessions);
+                setSessionsCursor(page.nextCursor);
+            })
             .catch(() => { });
     }, []);
 
+    // ── Load the next (older) page of sessions ────────────────────────────────
+    const loadMoreSessions = useCallback(async () => {
+        if (!sessionsCursor || loadingMoreSessions) return;
+        setLoadingMoreSessions(true);
+        try {
+            const page = await apiListSessions({ before: sessionsCursor });
+            setSessions((prev) => {
+                const known = new Set(prev.map((s) => s.id));
+                return [...prev, ...page.sessions.filter((s) => !known.has(s.id))];
+            });
+            setSessionsCursor(page.nextCursor);
+        } catch (err) {
+            console.error(err);
+        } finally {
+            setLoadingMoreSessions(false);
+        }
+    }, [sessionsCursor, loadingMoreSessions]);
+
     const newChat = useCallback(() => {
         streamControllerRef.current?.abort();
         setActiveSessionId(null);
         setMessages([]);
+        setOlderMessagesCursor(null);
     }, []);
 
+    const toChatMessages = (msgs) => msgs.map((m) => ({
+        role: m.role === "human" ? "user" : "ai",
+        text: m.content,
+        source: m.source ?? null,
+    }));
+
     const openSession = useCallback(async (id) => {
         if (id === activeSessionId) return;
         streamControllerRef.current?.abort();
         setActiveSessionId(id);
         setMessages([]);
+        setOlderMessagesCursor(null);
         setLoadingSession(true);
         try {
-            const msgs = await apiGetSession(id);
-            setMessages(msgs.map((m) => ({
-                role: m.role === "human" ? "user" : "ai",
-                text: m.content,
-                source: m.source ?? null,
-            })));
+            const page = await apiGetSession(id);
+            setMessages(toChatMessages(page.messages));
+            setOlderMessagesCursor(page.nextCursor);
         } catch {
             setMessages([{ role: "ai", text: "Failed to load conversation." }]);
         } finally {
@@ -50,6 +85,23 @@ export function useChat() {
         }
     }, [activeSessionId]);
 
+    // ── Load the page of messages before the oldest one shown ─────────────────
+    const loadOlderMessages = useCallback(async () => {
+        if (!activeSessionId || !olderMessagesCursor || loadingOlderMessages) return;
+        const sessionId = activeSessionId;
+        setLoadingOlderMessages(true);
+        try {
+            const page = await apiGetSession(sessionId, { before: olderMessagesCursor });
+            if (activeSessionRef.current !== sessionId) return; // switched away meanwhile
+            setMessages((m) => [...toChatMessages(page.messages), ...m]);
+            setOlderMessagesCursor(page.nextCursor);
+        } catch (err) {
+            console.error(err);
+        } finally {
+            setLoadingOlderMessages(false);
+        }
+    }, [activeSessionId, olderMessagesCursor, loadingOlderMessages]);
+
     const deleteSession = useCallback(async (e, id) => {
         e?.stopPropagation();
         await apiDeleteSession(id).catch(() => { });
@@ -57,6 +109,7 @@ export function useChat() {
         if (activeSessionId === id) {
             setActiveSessionId(null);
             setMessages([]);
+            setOlderMessagesCursor(null);
         }
     }, [activeSessionId]);
 
@@ -66,6 +119,7 @@ export function useChat() {
         setSessions((s) => s.filter((x) => x.id !== activeSessionId));
         setActiveSessionId(null);
         setMessages([]);
+        setOlderMessagesCursor(null);
     }, [activeSessionId]);
 
     const renameActiveSession = useCallback(async (newName) => {
@@ -129,11 +183,25 @@ export function useChat() {
                 },
                 onDone: () => {
                     setStreaming(false);
-                    // Refresh session name (title may have been generated)
+                    // Refresh activity (last message, preview) of the first page,
+                    // keeping a title pushed by onTitle that the list may predate
+                    // and any older pages already loaded
                     apiListSessions()
-                        .then(setSessions)
+                        .then(({ sessions: list }) => setSessions((prev) => {
+                            const fresh = new Set(list.map((s) => s.id));
+                            return [
+                                ...list.map((s) =>
+                                    s.name ? s : { ...s, name: prev.find((p) => p.id === s.id)?.name ?? null }
+                                ),
+                                ...prev.filter((p) => !fresh.has(p.id)),
+                            ];
+                        }))
                         .catch(() => { });
                 },
+                onTitle: (sid, sname) => {
+                    if (!sname) return;
+                    setSessions((prev) => prev.map((s) => s.id === sid ? { ...s, name: sname } : s));
+                },
                 onError: (err) => {
                     setStreaming(false);
                     if (err === "session_expired") return; // global handler fires
@@ -156,11 +224,17 @@ export function useChat() {
     return {
         activeSessionId,
         sessions,
+        hasMoreSessions: sessionsCursor !== null,
+        loadingMoreSessions,
+        loadMoreSessions,
         messages,
         input,
         setInput,
         streaming,
         loadingSession,
+        hasOlderMessages: olderMessagesCursor !== null,
+        loadingOlderMessages,
+        loadOlderMessages,
         newChat,
         openSession,
         deleteSession,
@@ -18,26 +18,39 @@ export async function apiAsk(query, sessionId = null) {
 // ─── Ask Stream (SSE via fetch so cookies are forwarded) ──────────────────────
 //
 // Calls the backend GET /ask/stream endpoint and parses the SSE events:
-//   { type: "session",  session_id, session_name }
+//   { type: "session",  session_id, session_name, run_id }
 //   { type: "token",   token }
 //   { type: "done" }
+//   { type: "title",   session_id, session_name }   (first turn, after done)
 //   { type: "error",   error }
 //
 // Callbacks:
 //   onSession(sessionId, sessionName) — fired once at stream start
 //   onToken(token)                    — fired for each streamed token
 //   onDone()                          — fired when streaming is complete
+//   onTitle(sessionId, sessionName)   — fired when a new session's title is ready
 //   onError(message)                  — fired on error
 //
+// Every event carries an `id: <run_id>:<seq>` line. If the connection drops
+// before the stream ends, it is resumed (up to STREAM_RESUME_ATTEMPTS times)
+// by sending the last id seen as Last-Event-ID: the backend replays the
+// missed events from its buffer instead of generating the answer again.
+//
 // Returns an AbortController so the caller can cancel the stream.
 
-export function apiAskStream(query, sessionId, { onSession, onToken, onDone, onError, onSource }) {
+const STREAM_RESUME_ATTEMPTS = 3;
+const STREAM_RESUME_DELAY_MS = 500;
+
+export function apiAskStream(query, sessionId, { onSession, onToken, onDone, onError, onSource, onTitle }) {
     const controller = new AbortController();
 
     const params = new URLSearchParams({ query });
     if (sessionId) params.set("session_id", sessionId);
     const url = `${API}/ask/stream?${params}`;
 
+    const callbacks = { onSession, onToken, onDone, onError, onSource, onTitle };
+    const cursor = { lastEventId: null, ended: false };
+
     (async () => {
         try {
             const res = await fetch(url, {
@@ -62,12 +75,12 @@ export function apiAskStream(query, sessionId, { onSession, onToken, onDone, onE
                     signal: controller.signal,
                 });
                 if (!retryRes.ok) { onError?.("Request failed"); return; }
-                await _readSSEStream(retryRes.body, { onSession, onToken, onDone, onError, onSource });
+                await _readResumable(retryRes.body, cursor, callbacks, controller.signal);
                 return;
             }
 
             if (!res.ok) { onError?.("Request failed"); return; }
-            await _readSSEStream(res.body, { onSession, onToken, onDone, onError, onSource });
+            await _readResumable(res.body, cursor, callbacks, controller.signal);
 
         } catch (err) {
             if (err.name !== "AbortError") onError?.(err.message);
@@ -77,7 +90,33 @@ export function apiAskStream(query, sessionId, { onSession, onToken, onDone, onE
     return controller;
 }
 
-async function _readSSEStream(body, { onSession, onToken, onDone, onError, onSource }) {
+// Read the stream; on a dropped connection reconnect with Last-Event-ID.
+async function _readResumable(body, cursor, callbacks, signal) {
+    for (let attempt = 0; ; attempt++) {
+        try {
+            await _readSSEStream(body, cursor, callbacks);
+            if (cursor.ended) return;
+        } catch (err) {
+            if (err.name === "AbortError") throw err;
+        }
+        // Cut off before "done": give up (so the caller stops waiting) or resume
+        if (!cursor.lastEventId || attempt >= STREAM_RESUME_ATTEMPTS) {
+            callbacks.onError?.("Stream lost");
+            return;
+        }
+
+        await new Promise((resolve) => setTimeout(resolve, STREAM_RESUME_DELAY_MS));
+        const res = await fetch(`${API}/ask/stream`, {
+            credentials: "include",
+            headers: { "Last-Event-ID": cursor.lastEventId },
+            signal,
+        });
+        if (!res.ok) { callbacks.onError?.("Connection lost"); return; }
+        body = res.body;
+    }
+}
+
+async function _readSSEStream(body, cursor, { onSession, onToken, onDone, onError, onSource, onTitle }) {
     const reader = body.getReader();
     const decoder = new TextDecoder();
     let buffer = "";
@@ -91,6 +130,7 @@ async function _readSSEStream(body, { onSession, onToken, onDone, onError, onSou
         buffer = lines.pop(); // keep incomplete last line
 
         for (const line of lines) {
+            if (line.startsWith("id: ")) { cursor.lastEventId = line.slice(4).trim(); continue; }
             if (!line.startsWith("data: ")) continue;
             const raw = line.slice(6).trim();
             if (!raw) continue;
@@ -102,7 +142,8 @@ async function _readSSEStream(body, { onSession, onToken, onDone, onError, onSou
             if (event.type === "session") onSession?.(event.session_id, event.session_name);
             else if (event.type === "token") onToken?.(event.token);
             else if (event.type === "source") onSource?.(event.source);
-            else if (event.type === "done") onDone?.();
+            else if (event.type === "done") { cursor.ended = true; onDone?.(); }
+            else if (event.type === "title") onTitle?.(event.session_id, event.session_name);
             else if (event.type === "error") onError?.(event.error);
         }
     }
@@ -2,16 +2,24 @@ import { API, fetchWithRefresh } from "./client";
 
 // ─── Sessions ─────────────────────────────────────────────────────────────────
 
-export async function apiListSessions() {
-    const res = await fetchWithRefresh(`${API}/ask/sessions`);
+export async function apiListSessions({ limit = 100, before } = {}) {
+    const params = new URLSearchParams({ limit });
+    if (before) params.set("before", before);
+    const res = await fetchWithRefresh(`${API}/ask/sessions?${params}`);
     if (!res.ok) throw new Error("Failed to load sessions");
-    return res.json(); // [{ id, name, created_at }]
+    const page = await res.json(); // { sessions: [{ id, name, created_at, last_message_at, message_count, preview }], next_cursor }
+    // Most recent first; nextCursor (if any) fetches the next, older page
+    return { sessions: page.sessions, nextCursor: page.next_cursor };
 }
 
-export async function apiGetSession(sessionId) {
-    const res = await fetchWithRefresh(`${API}/ask/sessions/${sessionId}`);
+export async function apiGetSession(sessionId, { limit = 200, before } = {}) {
+    const params = new URLSearchParams({ limit });
+    if (before) params.set("before", before);
+    const res = await fetchWithRefresh(`${API}/ask/sessions/${sessionId}?${params}`);
     if (!res.ok) throw new Error("Failed to load session");
-    return res.json(); // [{ id, role, content, created_at }]
+    const page = await res.json(); // { messages: [{ id, role, content, created_at }], next_cursor }
+    // Messages are oldest first; nextCursor (if any) fetches the page before them
+    return { messages: page.messages, nextCursor: page.next_cursor };
 }
 
 export async function apiDeleteSession(sessionId) {